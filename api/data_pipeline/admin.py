@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import SensorReading, GridData, UserPreferences, AIDecision, EnergySource, Load, SourceSwitchEvent
+from .models import SensorReading, LatestSensorReading, GridData, UserPreferences, AIDecision, EnergySource, Load, SourceSwitchEvent
 
 
 @admin.register(SensorReading)
@@ -11,6 +11,14 @@ class SensorReadingAdmin(admin.ModelAdmin):
     date_hierarchy = 'timestamp'
 
 
+@admin.register(LatestSensorReading)
+class LatestSensorReadingAdmin(admin.ModelAdmin):
+    list_display = ('sensor_type', 'sensor_id', 'value', 'unit', 'location', 'timestamp')
+    list_filter = ('sensor_type',)
+    search_fields = ('sensor_id', 'location')
+    ordering = ('sensor_type', 'sensor_id')
+
+
 @admin.register(GridData)
 class GridDataAdmin(admin.ModelAdmin):
     list_display = ('data_type', 'value', 'unit', 'zone', 'timestamp')
@@ -0,0 +1,90 @@
+"""
+Native async views for the hottest read-only dashboard endpoints.
+
+Under ASGI (daphne), Django runs every sync view on one shared thread per
+worker, so DRF viewset actions are handled one at a time. These views run on
+the event loop and await the database and cache instead, letting a single
+worker overlap many concurrent polls. They are routed ahead of the DRF router
+and keep the same URLs, parameters and response shapes.
+
+These are plain Django views, so REST_FRAMEWORK settings do not apply to them:
+there is no content negotiation, browsable API, authentication, permission or
+throttle handling. Bodies are encoded with hypervolt_backend.renderers.dumps so
+the JSON matches ORJSONRenderer. If DRF policies are added to the project,
+enforce them here too or route these URLs back to the viewsets.
+"""
+from datetime import datetime
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework import serializers
+
+from hypervolt_backend.renderers import dumps
+
+from .models import GridData, LatestSensorReading
+from .response_cache import RESPONSE_CACHE_TTL, grid_latest_key, sensor_latest_key
+from .serializers import LatestSensorReadingSerializer
+
+# (output key, model column) pairs each endpoint returns, matching its serializer
+SENSOR_LATEST_FIELDS = tuple(
+    (name, field.source) for name, field in LatestSensorReadingSerializer().fields.items()
+)
+GRID_LATEST_FIELDS = tuple((field.name, field.name) for field in GridData._meta.concrete_fields)
+
+_format_datetime = serializers.DateTimeField().to_representation
+
+
+async def _cached_values(key, queryset, fields):
+    """
+    Return `queryset` rows as JSON through the shared response cache.
+
+    Rows are read with values_list() and built into dicts directly, skipping
+    model instantiation and the serializer stack; datetimes are formatted the
+    same way DateTimeField serializes them.
+    """
+    data = await cache.aget(key)
+    if data is None:
+        names, columns = zip(*fields)
+        data = [
+            {
+                name: _format_datetime(value) if isinstance(value, datetime) else value
+                for name, value in zip(names, row)
+            }
+            async for row in queryset.values_list(*columns)
+        ]
+        await cache.aset(key, data, RESPONSE_CACHE_TTL)
+    return HttpResponse(dumps(data), content_type='application/json')
+
+
+@require_GET
+async def sensor_latest(request):
+    """Get the latest reading for each sensor."""
+    sensor_type = request.GET.get('sensor_type')
+    sensor_id = request.GET.get('sensor_id')
+
+    filters = {}
+    if sensor_type:
+        filters['sensor_type'] = sensor_type
+    if sensor_id:
+        filters['sensor_id'] = sensor_id
+    # One row per (sensor_type, sensor_id), maintained on write
+    queryset = LatestSensorReading.objects.filter(**filters)
+
+    return await _cached_values(
+        sensor_latest_key(sensor_type, sensor_id), queryset, SENSOR_LATEST_FIELDS
+    )
+
+
+@require_GET
+async def grid_latest(request):
+    """Get the latest data for each data type."""
+    data_type = request.GET.get('data_type')
+
+    filters = {'data_type': data_type} if data_type else {}
+    queryset = GridData.objects.filter(**filters)
+
+    # Get latest for each data type, resolved in the database
+    return await _cached_values(
+        grid_latest_key(data_type), queryset.latest_per('data_type'), GRID_LATEST_FIELDS
+    )
@@ -0,0 +1,28 @@
+"""
+Django management command to remove sensor buffers in the old pickled format.
+
+Buffers used to be stored through the cache API as one pickled list under the
+versioned key (":1:sensor_buffer:<type>:<id>"); they are now raw Redis lists
+under the bare key. Nothing reads the old keys any more and they expire within
+BUFFER_TTL, so running this once after deploying is optional housekeeping.
+
+Usage:
+    python manage.py clear_legacy_sensor_buffers
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Deletes sensor buffers left in the old pickled cache format'
+
+    def handle(self, *args, **options):
+        if not hasattr(cache, 'delete_pattern'):
+            raise CommandError('The default cache is not django-redis; there are no legacy buffers to clear')
+
+        # delete_pattern applies the cache's key prefix and version, so this
+        # matches only the old entries and never the bare-key Redis lists
+        deleted = cache.delete_pattern(f"{settings.SENSOR_BUFFER_KEY_PREFIX}:*")
+
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} legacy sensor buffer(s)'))
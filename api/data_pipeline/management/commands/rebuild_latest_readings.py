@@ -0,0 +1,42 @@
+"""
+Django management command to rebuild the latest-reading summary table.
+
+The table is normally maintained by a post_save handler; run this after
+loading readings in bulk (bulk_create, raw SQL, fixtures), which bypasses it.
+
+Usage:
+    python manage.py rebuild_latest_readings
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from data_pipeline.models import LatestSensorReading, SensorReading
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the per-sensor latest reading table from the sensor time series'
+
+    def handle(self, *args, **options):
+        # One row per (sensor_type, sensor_id): DISTINCT ON on PostgreSQL
+        readings = SensorReading.objects.latest_per('sensor_type', 'sensor_id').only(
+            'sensor_type', 'sensor_id', 'value', 'unit', 'location', 'timestamp', 'created_at'
+        )
+        latest = [
+            LatestSensorReading(
+                sensor_type=reading.sensor_type,
+                sensor_id=reading.sensor_id,
+                value=reading.value,
+                unit=reading.unit,
+                location=reading.location,
+                timestamp=reading.timestamp,
+                reading_id=reading.pk,
+                reading_created_at=reading.created_at,
+            )
+            for reading in readings
+        ]
+
+        with transaction.atomic():
+            LatestSensorReading.objects.all().delete()
+            LatestSensorReading.objects.bulk_create(latest, batch_size=500)
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt latest readings for {len(latest)} sensor(s)'))
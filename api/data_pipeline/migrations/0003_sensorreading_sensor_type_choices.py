@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_pipeline', '0002_load_sourceswitchevent'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='sensorreading',
+            name='sensor_type',
+            field=models.CharField(choices=[('ldr', 'Light Dependent Resistor'), ('current', 'Current Sensor'), ('temperature', 'Temperature Sensor'), ('humidity', 'Humidity Sensor'), ('voltage', 'Voltage Sensor')], db_index=True, max_length=20),
+        ),
+    ]
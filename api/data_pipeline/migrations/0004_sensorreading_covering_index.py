@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_pipeline', '0003_sensorreading_sensor_type_choices'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='sensorreading',
+            name='data_pipeli_sensor__0c6fd6_idx',
+        ),
+        migrations.AddIndex(
+            model_name='sensorreading',
+            index=models.Index(fields=['sensor_type', '-timestamp'], include=('value', 'unit'), name='sr_type_ts_idx'),
+        ),
+    ]
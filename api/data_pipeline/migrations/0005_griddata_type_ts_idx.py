@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:16
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_pipeline', '0004_sensorreading_covering_index'),
+    ]
+
+    operations = [
+        migrations.RenameIndex(
+            model_name='griddata',
+            new_name='gd_type_ts_idx',
+            old_name='data_pipeli_data_ty_894eae_idx',
+        ),
+    ]
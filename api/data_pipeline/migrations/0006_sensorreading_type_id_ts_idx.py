@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_pipeline', '0005_griddata_type_ts_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sensorreading',
+            index=models.Index(fields=['sensor_type', 'sensor_id', '-timestamp'], name='sr_type_id_ts_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:28
+
+from django.db import migrations, models
+
+
+def backfill_latest_readings(apps, schema_editor):
+    SensorReading = apps.get_model('data_pipeline', 'SensorReading')
+    LatestSensorReading = apps.get_model('data_pipeline', 'LatestSensorReading')
+
+    sensors = SensorReading.objects.order_by().values_list('sensor_type', 'sensor_id').distinct()
+    latest = []
+    for sensor_type, sensor_id in sensors:
+        reading = SensorReading.objects.filter(
+            sensor_type=sensor_type, sensor_id=sensor_id
+        ).order_by('-timestamp').first()
+        latest.append(LatestSensorReading(
+            sensor_type=sensor_type,
+            sensor_id=sensor_id,
+            value=reading.value,
+            unit=reading.unit,
+            location=reading.location,
+            timestamp=reading.timestamp,
+            reading_id=reading.pk,
+            reading_created_at=reading.created_at,
+        ))
+    LatestSensorReading.objects.bulk_create(latest, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_pipeline', '0006_sensorreading_type_id_ts_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LatestSensorReading',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sensor_type', models.CharField(choices=[('ldr', 'Light Dependent Resistor'), ('current', 'Current Sensor'), ('temperature', 'Temperature Sensor'), ('humidity', 'Humidity Sensor'), ('voltage', 'Voltage Sensor')], max_length=20)),
+                ('sensor_id', models.CharField(max_length=50)),
+                ('value', models.FloatField()),
+                ('unit', models.CharField(default='raw', max_length=20)),
+                ('location', models.CharField(blank=True, max_length=100)),
+                ('timestamp', models.DateTimeField()),
+                ('reading_id', models.BigIntegerField(help_text='Primary key of the SensorReading this row mirrors')),
+                ('reading_created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-timestamp'],
+                'constraints': [models.UniqueConstraint(fields=('sensor_type', 'sensor_id'), name='latest_sensor_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_latest_readings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_pipeline', '0007_latestsensorreading'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='griddata',
+            name='gd_type_ts_idx',
+        ),
+        migrations.AddIndex(
+            model_name='griddata',
+            index=models.Index(fields=['data_type', '-timestamp'], include=('value', 'unit'), name='gd_type_ts_idx'),
+        ),
+    ]
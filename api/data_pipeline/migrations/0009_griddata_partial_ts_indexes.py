@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_pipeline', '0008_griddata_covering_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='griddata',
+            index=models.Index(condition=models.Q(('data_type', 'carbon_intensity')), fields=['-timestamp'], name='gd_ci_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='griddata',
+            index=models.Index(condition=models.Q(('data_type', 'weather')), fields=['-timestamp'], name='gd_weather_ts_idx'),
+        ),
+    ]
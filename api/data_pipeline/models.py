@@ -1,7 +1,34 @@
-from django.db import models
+from django.db import connections, models
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 
 
+class LatestPerQuerySet(models.QuerySet):
+    """
+    QuerySet for time-series models that need "latest row per group" lookups.
+    """
+
+    def latest_per(self, *fields):
+        """
+        Return the most recent row for each distinct combination of `fields` in one query.
+
+        Uses PostgreSQL's DISTINCT ON when available (a single index scan over
+        `(*fields, -timestamp)`), and falls back to a ROW_NUMBER() window filter on
+        other backends such as the SQLite development database.
+        """
+        if connections[self.db].features.can_distinct_on_fields:
+            return self.order_by(*fields, '-timestamp').distinct(*fields)
+
+        return self.annotate(
+            _row_number=Window(
+                expression=RowNumber(),
+                partition_by=[F(field) for field in fields],
+                order_by=F('timestamp').desc(),
+            )
+        ).filter(_row_number=1).order_by(*fields)
+
+
 class SensorReading(models.Model):
     """
     Time-series model for sensor data from the Raspberry Pi.
@@ -23,11 +50,43 @@ class SensorReading(models.Model):
     timestamp = models.DateTimeField(default=timezone.now, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = LatestPerQuerySet.as_manager()
+
     class Meta:
         ordering = ['-timestamp']
         indexes = [
-            models.Index(fields=['sensor_type', '-timestamp']),
+            # Covering index for "latest per sensor type" lookups (PostgreSQL)
+            models.Index(fields=['sensor_type', '-timestamp'], name='sr_type_ts_idx', include=['value', 'unit']),
             models.Index(fields=['sensor_id', '-timestamp']),
+            # Serves "latest per sensor" lookups
+            models.Index(fields=['sensor_type', 'sensor_id', '-timestamp'], name='sr_type_id_ts_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.sensor_type} ({self.sensor_id}): {self.value} at {self.timestamp}"
+
+
+class LatestSensorReading(models.Model):
+    """
+    Summary table holding the most recent reading for each sensor.
+
+    Kept current by a post_save handler on SensorReading so "latest per
+    sensor" reads scan one small row per sensor instead of the time series.
+    """
+    sensor_type = models.CharField(max_length=20, choices=SensorReading.SENSOR_TYPE_CHOICES)
+    sensor_id = models.CharField(max_length=50)
+    value = models.FloatField()
+    unit = models.CharField(max_length=20, default='raw')
+    location = models.CharField(max_length=100, blank=True)
+    timestamp = models.DateTimeField()
+    reading_id = models.BigIntegerField(help_text="Primary key of the SensorReading this row mirrors")
+    reading_created_at = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-timestamp']
+        constraints = [
+            models.UniqueConstraint(fields=['sensor_type', 'sensor_id'], name='latest_sensor_unique'),
         ]
 
     def __str__(self):
@@ -53,11 +112,17 @@ class GridData(models.Model):
     timestamp = models.DateTimeField(default=timezone.now, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = LatestPerQuerySet.as_manager()
+
     class Meta:
         ordering = ['-timestamp']
         indexes = [
-            models.Index(fields=['data_type', '-timestamp']),
+            # Covering index for "latest per data type" and carbon intensity lookups
+            models.Index(fields=['data_type', '-timestamp'], name='gd_type_ts_idx', include=['value', 'unit']),
             models.Index(fields=['zone', '-timestamp']),
+            # Slim partial indexes for the carbon_intensity and weather series actions
+            models.Index(fields=['-timestamp'], name='gd_ci_ts_idx', condition=models.Q(data_type='carbon_intensity')),
+            models.Index(fields=['-timestamp'], name='gd_weather_ts_idx', condition=models.Q(data_type='weather')),
         ]
 
     def __str__(self):
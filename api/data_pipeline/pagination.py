@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class TimestampCursorPagination(CursorPagination):
+    """
+    Keyset pagination for time-series endpoints.
+
+    Each page is a bounded range scan on the timestamp index, so response
+    size and query cost stay flat however large the table grows.
+    """
+    ordering = '-timestamp'
+    page_size = 500
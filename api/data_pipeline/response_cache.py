@@ -0,0 +1,117 @@
+"""
+Short-lived response caching for read-heavy dashboard endpoints.
+
+Responses are cached cache-aside in the default (Redis) cache under keys
+derived from the request. Writes invalidate the affected keys through the
+handlers in signals.py; the TTL bounds staleness for writes that bypass
+signals, such as bulk_create.
+"""
+import functools
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from hypervolt_backend.renderers import dumps
+
+RESPONSE_CACHE_TTL = 10  # seconds
+
+# Endpoints whose data changes every few seconds are cached on a short TTL
+# alone; invalidating on every write would leave almost nothing to hit.
+POLLING_CACHE_TTL = 2  # seconds
+SENSOR_ALL_LATEST_CACHE_KEY = 'latest:sensor:all'
+
+# Process-local cache for UserPreferences lookups: key -> (expires_at, data).
+# Saves in this process clear it immediately; the TTL bounds staleness from
+# edits made in other worker processes.
+PREFERENCE_CACHE_TTL = 30  # seconds
+PREFERENCE_CACHE_MAXSIZE = 256
+_preference_cache = {}
+
+AVAILABLE_SOURCES_CACHE_KEY = 'available:energy_sources'
+
+
+def sensor_latest_key(sensor_type=None, sensor_id=None):
+    """Cache key for SensorReadingViewSet.latest with the given filters."""
+    return f"latest:sensor:{sensor_type or ''}:{sensor_id or ''}"
+
+
+def grid_latest_key(data_type=None):
+    """Cache key for GridDataViewSet.latest with the given filter."""
+    return f"latest:grid:{data_type or ''}"
+
+
+def decision_latest_key(decision_type=None):
+    """Cache key for AIDecisionViewSet.latest with the given filter."""
+    return f"latest:decision:{decision_type or ''}"
+
+
+def cache_response(key_fn, ttl=RESPONSE_CACHE_TTL, etag=False):
+    """
+    Cache the data of successful responses from a viewset action.
+
+    Args:
+        key_fn: Callable taking the request and returning the cache key
+        ttl: Time to live in seconds
+        etag: Store a hash of the data next to it, send it as the ETag and
+            answer a matching If-None-Match with 304, all without touching
+            the database on a hit
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(self, request, *args, **kwargs):
+            key = key_fn(request)
+            cached = cache.get(key)
+            if cached is not None:
+                if not etag:
+                    return Response(cached)
+                data, tag = cached
+            else:
+                response = view(self, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                if not etag:
+                    cache.set(key, response.data, ttl)
+                    return response
+                data = response.data
+                tag = quote_etag(hashlib.md5(dumps(data)).hexdigest())
+                cache.set(key, (data, tag), ttl)
+
+            if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+            if tag in if_none_match or '*' in if_none_match:
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            else:
+                response = Response(data)
+            response['ETag'] = tag
+            return response
+        return wrapper
+    return decorator
+
+
+def get_cached_preference(key, load):
+    """
+    Return serialized preference data for `key`, calling `load(key)` on a miss.
+
+    `load` returns None when the preference does not exist; misses are not
+    cached, so a preference created in another process shows up immediately.
+    """
+    now = time.monotonic()
+    cached = _preference_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    data = load(key)
+    if data is None:
+        return None
+    if len(_preference_cache) >= PREFERENCE_CACHE_MAXSIZE:
+        _preference_cache.clear()
+    _preference_cache[key] = (now + PREFERENCE_CACHE_TTL, data)
+    return data
+
+
+def clear_preference_cache():
+    """Forget every locally cached preference."""
+    _preference_cache.clear()
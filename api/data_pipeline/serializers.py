@@ -1,17 +1,49 @@
+from django.db import models
 from rest_framework import serializers
-from .models import SensorReading, GridData, UserPreferences, AIDecision, EnergySource, Load, SourceSwitchEvent
+from .models import SensorReading, LatestSensorReading, GridData, UserPreferences, AIDecision, EnergySource, Load, SourceSwitchEvent
+
+
+class ChunkedListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer that reads unevaluated querysets in chunks.
+
+    Rows are streamed with iterator() instead of being loaded into the
+    queryset's result cache first, and the child's to_representation is
+    bound once for the whole list.
+    """
+    chunk_size = 1000
+
+    def to_representation(self, data):
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+        if isinstance(data, models.QuerySet) and data._result_cache is None:
+            to_representation = self.child.to_representation
+            return [to_representation(item) for item in data.iterator(chunk_size=self.chunk_size)]
+        return super().to_representation(data)
 
 
 class SensorReadingSerializer(serializers.ModelSerializer):
     class Meta:
         model = SensorReading
+        list_serializer_class = ChunkedListSerializer
         fields = '__all__'
         read_only_fields = ('created_at',)
 
 
+class LatestSensorReadingSerializer(serializers.ModelSerializer):
+    # Expose the mirrored reading's identity so rows match SensorReadingSerializer
+    id = serializers.IntegerField(source='reading_id', read_only=True)
+    created_at = serializers.DateTimeField(source='reading_created_at', read_only=True)
+
+    class Meta:
+        model = LatestSensorReading
+        fields = ('id', 'sensor_type', 'sensor_id', 'value', 'unit', 'location', 'timestamp', 'created_at')
+
+
 class GridDataSerializer(serializers.ModelSerializer):
     class Meta:
         model = GridData
+        list_serializer_class = ChunkedListSerializer
         fields = '__all__'
         read_only_fields = ('created_at',)
 
@@ -26,6 +58,7 @@ class UserPreferencesSerializer(serializers.ModelSerializer):
 class AIDecisionSerializer(serializers.ModelSerializer):
     class Meta:
         model = AIDecision
+        list_serializer_class = ChunkedListSerializer
         fields = '__all__'
         read_only_fields = ('created_at',)
 
@@ -1,12 +1,14 @@
 # Services module initialization
 from .electricity_maps import ElectricityMapsService
 from .weather import WeatherService
-from .cache_manager import SensorBufferManager
-from .energy_optimizer import EnergySourceOptimizer
+from .cache_manager import SensorBufferManager, get_buffer_manager
+from .energy_optimizer import EnergySourceOptimizer, get_energy_optimizer
 
 __all__ = [
     'ElectricityMapsService',
     'WeatherService',
     'SensorBufferManager',
+    'get_buffer_manager',
     'EnergySourceOptimizer',
+    'get_energy_optimizer',
 ]
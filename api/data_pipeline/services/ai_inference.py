@@ -7,6 +7,7 @@ This service provides an interface for the API to call AI models for:
 - Real-time decision making
 """
 
+import logging
 import os
 import sys
 import numpy as np
@@ -20,6 +21,8 @@ import paho.mqtt.publish as publish
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 
+logger = logging.getLogger(__name__)
+
 # Add AI module to path
 AI_MODULE_PATH = os.path.join(settings.BASE_DIR, '..', 'ai', 'module3-ai')
 sys.path.insert(0, AI_MODULE_PATH)
@@ -30,7 +33,7 @@ try:
     from optimize_sources import SourceOptimizer, EnergySource
     AI_AVAILABLE = True
 except ImportError as e:
-    print(f"Warning: AI modules not available: {e}")
+    logger.warning("AI modules not available: %s", e)
     AI_AVAILABLE = False
 
 
@@ -73,13 +76,13 @@ class AIInferenceService:
             self.forecaster = EnergyDemandForecaster(lookback_hours=24, forecast_horizon=6)
 
             if os.path.exists(model_path) and os.path.exists(scaler_path):
-                print(f"Loading AI model from: {model_path}")
+                logger.info("Loading AI model from: %s", model_path)
                 self.forecaster.model_path = model_path
                 self.forecaster.load_model()
                 self.models_loaded = True
             else:
-                print(f"Warning: Model files not found in {ai_models_dir}")
-                print("Please run 'python ai/module3-ai/train_demand_model.py' first.")
+                logger.warning("Model files not found in %s", ai_models_dir)
+                logger.warning("Please run 'python ai/module3-ai/train_demand_model.py' first.")
                 self.models_loaded = False
 
             # Initialize Optimizer
@@ -89,7 +92,7 @@ class AIInferenceService:
             )
 
         except Exception as e:
-            print(f"Error initializing AI models: {e}")
+            logger.error("Error initializing AI models: %s", e)
             self.models_loaded = False
     
     def is_available(self) -> bool:
@@ -124,7 +127,7 @@ class AIInferenceService:
             self.optimizer.carbon_weight = carbon_weight
             
         except Exception as e:
-            print(f"Error updating weights: {e}")
+            logger.warning("Error updating weights: %s", e)
     
     def forecast_demand(self, hours_ahead: int = 6) -> Dict:
         """
@@ -336,7 +339,7 @@ class AIInferenceService:
                 hostname="localhost",
                 port=1883
             )
-            print(f"✓ Published AI decision to MQTT: {primary_source}")
+            logger.debug("Published AI decision to MQTT: %s", primary_source)
 
             # 2. NEW: WebSocket Broadcast (To Frontend)
             channel_layer = get_channel_layer()
@@ -350,10 +353,10 @@ class AIInferenceService:
                     }
                 }
             )
-            print(f"✓ Broadcasted AI decision to Frontend")
+            logger.debug("Broadcast AI decision to frontend")
 
         except Exception as e:
-            print(f"Failed to publish AI decision: {e}")
+            logger.warning("Failed to publish AI decision: %s", e)
 
 
     def trigger_retraining(self) -> Dict:
@@ -434,7 +437,7 @@ class AIInferenceService:
             return csv_path
             
         except Exception as e:
-            print(f"Error exporting data to CSV: {e}")
+            logger.error("Error exporting data to CSV: %s", e)
             return None
     
     def _get_recent_data_for_forecasting(self) -> Optional[pd.DataFrame]:
@@ -507,7 +510,7 @@ class AIInferenceService:
             return df_final if len(df_final) >= 12 else None  # Allow partial data (min 12h)
             
         except Exception as e:
-            print(f"Error fetching historical data: {e}")
+            logger.warning("Error fetching historical data: %s", e)
             return None
     
     def _get_current_conditions(self) -> Dict:
@@ -524,13 +527,13 @@ class AIInferenceService:
                 return self._read_conditions_from_db()
 
         except Exception as e:
-            print(f"Error fetching conditions: {e}")
+            logger.warning("Error fetching conditions: %s", e)
             return self._get_fallback_conditions()
 
     def _read_conditions_from_file(self) -> Dict:
         """Reads the latest values from the CSV file"""
         if not os.path.exists(self.SIMULATION_FILE_PATH):
-            print("Simulation file not found, using fallback.")
+            logger.debug("Simulation file not found, using fallback.")
             return self._get_fallback_conditions()
 
         try:
@@ -556,7 +559,7 @@ class AIInferenceService:
             
             return conditions
         except Exception as e:
-            print(f"Error parsing simulation file: {e}")
+            logger.warning("Error parsing simulation file: %s", e)
             return self._get_fallback_conditions()
 
     def _read_conditions_from_db(self) -> Dict:
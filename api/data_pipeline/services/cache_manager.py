@@ -1,14 +1,42 @@
 """
 Cache management utilities for the Hot Path.
 Implements a sliding window buffer for the latest sensor readings.
+
+With the django-redis cache each buffer is a capped Redis list (RPUSH +
+LTRIM), so appends are atomic across processes and need no read-back.
+Other cache backends fall back to storing the buffer as one cached list.
+
+The Redis lists live under bare keys, so buffers written by the old pickled
+format are not read back and every buffer starts empty after upgrading; run
+the clear_legacy_sensor_buffers command to delete the leftovers early.
 """
+import functools
 import json
 import logging
+import threading
+import time
 from django.core.cache import cache
 from django.conf import settings
 
+try:
+    from django_redis import get_redis_connection
+except ImportError:
+    get_redis_connection = None
+
 logger = logging.getLogger(__name__)
 
+BUFFER_TTL = 3600  # seconds an idle sensor's buffer is kept
+
+
+def _native_redis():
+    """Raw Redis client behind the default cache, or None if it isn't django-redis."""
+    if get_redis_connection is None:
+        return None
+    try:
+        return get_redis_connection('default')
+    except NotImplementedError:
+        return None
+
 
 class SensorBufferManager:
     """
@@ -19,6 +47,15 @@ class SensorBufferManager:
     def __init__(self):
         self.buffer_size = settings.SENSOR_BUFFER_SIZE
         self.key_prefix = settings.SENSOR_BUFFER_KEY_PREFIX
+        # Process-local L1 cache in front of Redis: key -> (expires_at, buffer).
+        # Writes from this manager invalidate exactly; the short TTL bounds
+        # staleness from writers in other processes (e.g. the MQTT listener).
+        self.local_ttl = settings.SENSOR_BUFFER_LOCAL_TTL
+        self._local = {}
+        # Serializes the read-modify-write in add_reading across threads
+        # sharing this instance (fallback path only).
+        self._lock = threading.Lock()
+        self._redis = _native_redis()
 
     def _get_buffer_key(self, sensor_type, sensor_id):
         """Generate cache key for a specific sensor."""
@@ -37,22 +74,31 @@ class SensorBufferManager:
         """
         key = self._get_buffer_key(sensor_type, sensor_id)
         
-        # Get existing buffer or create new one
-        buffer = cache.get(key, [])
-        
         # Add new reading
         reading = {
             'value': value,
             'timestamp': timestamp
         }
-        buffer.append(reading)
-        
-        # Keep only the latest N readings (sliding window)
-        if len(buffer) > self.buffer_size:
-            buffer = buffer[-self.buffer_size:]
         
-        # Save back to cache (expire after 1 hour)
-        cache.set(key, buffer, 3600)
+        if self._redis is not None:
+            # Append and trim to the latest N readings in one transaction
+            pipe = self._redis.pipeline()
+            pipe.rpush(key, json.dumps(reading))
+            pipe.ltrim(key, -self.buffer_size, -1)
+            pipe.expire(key, BUFFER_TTL)
+            pipe.execute()
+        else:
+            with self._lock:
+                # Get existing buffer or create new one
+                buffer = cache.get(key, [])
+                buffer.append(reading)
+                
+                # Keep only the latest N readings (sliding window)
+                if len(buffer) > self.buffer_size:
+                    buffer = buffer[-self.buffer_size:]
+                
+                cache.set(key, buffer, BUFFER_TTL)
+        self._local.pop(key, None)
         
         logger.debug(f"Added reading to buffer {key}: {reading}")
 
@@ -69,11 +115,64 @@ class SensorBufferManager:
             list: List of readings in chronological order
         """
         key = self._get_buffer_key(sensor_type, sensor_id)
-        buffer = cache.get(key, [])
         
+        cached = self._local.get(key)
+        if cached and cached[0] > time.monotonic():
+            buffer = cached[1]
+        else:
+            buffer = self._fetch_buffers([key])[key]
+            self._local[key] = (time.monotonic() + self.local_ttl, buffer)
+        
+        # Hand out copies so callers can't mutate the shared L1 entry
         if count:
-            return buffer[-count:]
-        return buffer
+            return list(buffer[-count:])
+        return list(buffer)
+
+    def get_latest_readings_batch(self, pairs):
+        """
+        Get the buffers for several sensors in one cache round-trip.
+        
+        Args:
+            pairs: Iterable of (sensor_type, sensor_id) tuples
+        
+        Returns:
+            dict: Mapping (sensor_type, sensor_id) -> list of readings
+        """
+        now = time.monotonic()
+        keys = {pair: self._get_buffer_key(*pair) for pair in pairs}
+        buffers = {}
+        missing = []
+        
+        for pair, key in keys.items():
+            cached = self._local.get(key)
+            if cached and cached[0] > now:
+                buffers[pair] = list(cached[1])
+            else:
+                missing.append(pair)
+        
+        if missing:
+            fetched = self._fetch_buffers([keys[pair] for pair in missing])
+            expires_at = now + self.local_ttl
+            for pair in missing:
+                key = keys[pair]
+                buffer = fetched[key]
+                self._local[key] = (expires_at, buffer)
+                buffers[pair] = list(buffer)
+        
+        return buffers
+
+    def _fetch_buffers(self, keys):
+        """Read several buffers from the shared cache in one round-trip."""
+        if self._redis is not None:
+            pipe = self._redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.lrange(key, 0, -1)
+            return {
+                key: [json.loads(item) for item in items]
+                for key, items in zip(keys, pipe.execute())
+            }
+        fetched = cache.get_many(keys)
+        return {key: fetched.get(key, []) for key in keys}
 
     def get_all_buffers(self):
         """
@@ -90,7 +189,11 @@ class SensorBufferManager:
     def clear_buffer(self, sensor_type, sensor_id):
         """Clear the buffer for a specific sensor."""
         key = self._get_buffer_key(sensor_type, sensor_id)
-        cache.delete(key)
+        if self._redis is not None:
+            self._redis.delete(key)
+        else:
+            cache.delete(key)
+        self._local.pop(key, None)
         logger.info(f"Cleared buffer for {key}")
 
     def get_buffer_stats(self, sensor_type, sensor_id):
@@ -100,8 +203,15 @@ class SensorBufferManager:
         Returns:
             dict: Statistics including count, latest value, etc.
         """
-        buffer = self.get_latest_readings(sensor_type, sensor_id)
+        return self.summarize_buffer(self.get_latest_readings(sensor_type, sensor_id))
+
+    def summarize_buffer(self, buffer):
+        """
+        Compute buffer statistics from an already fetched buffer.
         
+        Returns:
+            dict: Statistics including count, latest value, etc.
+        """
         if not buffer:
             return {
                 'count': 0,
@@ -119,3 +229,13 @@ class SensorBufferManager:
             'max_value': max(values),
             'avg_value': sum(values) / len(values)
         }
+
+
+@functools.lru_cache(maxsize=1)
+def get_buffer_manager():
+    """
+    Return the process-wide SensorBufferManager.
+
+    Sharing one instance keeps its local cache warm across requests.
+    """
+    return SensorBufferManager()
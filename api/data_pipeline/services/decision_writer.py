@@ -0,0 +1,115 @@
+"""
+Background writer for the AIDecision audit trail.
+
+Recording a decision is bookkeeping, not part of the answer, so request
+handlers enqueue unsaved AIDecision rows and a daemon thread writes them in
+batches with bulk_create. Rows still queued at shutdown are flushed by an
+atexit hook. Decisions dropped on a full queue or lost to a failed write are
+counted; get_writer_stats() reports them.
+"""
+import atexit
+import logging
+import queue
+import threading
+
+from django.db import close_old_connections
+
+from data_pipeline.models import AIDecision
+
+logger = logging.getLogger(__name__)
+
+DECISION_QUEUE_SIZE = 1000
+DECISION_BATCH_SIZE = 100
+
+_decision_queue = queue.Queue(maxsize=DECISION_QUEUE_SIZE)
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+# Decisions that never reached the database, by cause
+_stats = {'dropped': 0, 'failed': 0}
+_stats_lock = threading.Lock()
+
+
+def _count(stat, n=1):
+    with _stats_lock:
+        _stats[stat] += n
+
+
+def _drain(first=None):
+    """Collect up to DECISION_BATCH_SIZE queued rows without blocking."""
+    batch = [first] if first is not None else []
+    while len(batch) < DECISION_BATCH_SIZE:
+        try:
+            batch.append(_decision_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _write(batch):
+    """Insert a batch of decisions, logging rather than raising on failure."""
+    try:
+        AIDecision.objects.bulk_create(batch, batch_size=DECISION_BATCH_SIZE)
+    except Exception as e:
+        _count('failed', len(batch))
+        logger.warning("Could not record %d AI decision(s): %s", len(batch), e)
+
+
+def _write_next():
+    """Block for the next queued row, then write it with whatever else is queued."""
+    first = _decision_queue.get()
+    batch = _drain(first)
+    # The writer thread outlives requests, so nothing else retires its
+    # connection when it hits CONN_MAX_AGE or breaks
+    close_old_connections()
+    _write(batch)
+
+
+def _run():
+    while True:
+        _write_next()
+
+
+def _ensure_writer():
+    global _writer_thread
+    if _writer_thread is not None:
+        return
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_run, name='ai-decision-writer', daemon=True)
+            _writer_thread.start()
+
+
+def record_decision(**fields):
+    """
+    Queue an AIDecision for writing in the background.
+
+    Accepts the same keyword arguments as AIDecision.objects.create(). If the
+    queue is full the decision is dropped with a warning.
+    """
+    _ensure_writer()
+    try:
+        _decision_queue.put_nowait(AIDecision(**fields))
+    except queue.Full:
+        _count('dropped')
+        logger.warning("AI decision queue full; dropping %s decision", fields.get('decision_type'))
+
+
+def flush_decisions():
+    """Write every queued decision from the calling thread."""
+    written = 0
+    while True:
+        batch = _drain()
+        if not batch:
+            return written
+        _write(batch)
+        written += len(batch)
+
+
+def get_writer_stats():
+    """Queue depth plus the number of decisions dropped or lost since startup."""
+    with _stats_lock:
+        return {'queued': _decision_queue.qsize(), **_stats}
+
+
+atexit.register(flush_decisions)
@@ -9,7 +9,9 @@ This service prepares the groundwork for Module 3 (AI) by:
 - Implementing basic fallback logic
 - Offering hooks for AI-based optimization
 """
+import functools
 import logging
+from django.core.cache import cache
 from django.utils import timezone
 from django.db.models import Q
 
@@ -17,12 +19,20 @@ from data_pipeline.models import (
     EnergySource, 
     SensorReading, 
     GridData, 
-    AIDecision,
     UserPreferences
 )
 
+from .decision_writer import record_decision
+
 logger = logging.getLogger(__name__)
 
+# Energy source configuration (availability, capacity, priority) changes rarely;
+# cache it and invalidate on save/delete (see data_pipeline.signals). The volatile
+# current_output is not cached - it is read live, so queryset.update() writes that
+# bypass the signals can't leave capacity checks working from stale output.
+ENERGY_SOURCES_CACHE_KEY = 'energy:sources:v2'
+ENERGY_SOURCES_CACHE_TTL = 300  # 5 minutes
+
 
 class EnergySourceOptimizer:
     """
@@ -59,11 +69,12 @@ class EnergySourceOptimizer:
         Returns:
             dict: Context including sensor data, weather, carbon intensity, etc.
         """
+        grid_data = self._get_latest_grid_data()
         context = {
             'timestamp': timezone.now().isoformat(),
             'energy_sources': self._get_energy_source_status(),
-            'weather': self._get_weather_context(),
-            'carbon_intensity': self._get_carbon_intensity(),
+            'weather': self._get_weather_context(grid_data),
+            'carbon_intensity': self._get_carbon_intensity(grid_data),
             'sensor_data': self._get_sensor_data(),
             'user_preferences': self._get_user_preferences(),
         }
@@ -72,74 +83,89 @@ class EnergySourceOptimizer:
         return context
     
     def _get_energy_source_status(self):
-        """Get current status of all energy sources."""
+        """Get current status of all energy sources (cached config, live output)."""
+        sources = cache.get_or_set(
+            ENERGY_SOURCES_CACHE_KEY,
+            self._load_energy_sources,
+            ENERGY_SOURCES_CACHE_TTL
+        )
+        outputs = dict(EnergySource.objects.values_list('source_type', 'current_output'))
+        return {
+            source_type: {
+                'available': status['available'],
+                'capacity': status['capacity'],
+                'current_output': outputs.get(source_type, 0),
+                'priority': status['priority'],
+            }
+            for source_type, status in sources.items()
+        }
+    
+    def _load_energy_sources(self):
+        """Load the slow-changing configuration of all energy sources."""
         sources = {}
-        for source in EnergySource.objects.all():
+        for source in EnergySource.objects.only('source_type', 'is_available', 'capacity', 'priority'):
             sources[source.source_type] = {
                 'available': source.is_available,
                 'capacity': source.capacity,
-                'current_output': source.current_output,
                 'priority': source.priority,
             }
         return sources
     
-    def _get_weather_context(self):
-        """Get weather context (for solar availability prediction)."""
+    def _get_latest_grid_data(self):
+        """Get the latest weather and carbon intensity rows in a single query."""
         try:
-            latest_weather = GridData.objects.filter(
-                data_type='weather'
-            ).order_by('-timestamp').first()
-            
-            if latest_weather:
-                return {
-                    'temperature': latest_weather.value,
-                    'cloud_cover': latest_weather.metadata.get('cloud_cover', 0),
-                    'condition': latest_weather.metadata.get('weather_condition', 'Unknown'),
-                    'timestamp': latest_weather.timestamp.isoformat(),
-                }
+            latest = GridData.objects.filter(
+                data_type__in=['weather', 'carbon_intensity']
+            ).latest_per('data_type').only('data_type', 'value', 'unit', 'metadata', 'timestamp')
+            return {data.data_type: data for data in latest}
         except Exception as e:
-            logger.error(f"Error getting weather context: {e}")
+            logger.error(f"Error getting grid data: {e}")
+        
+        return {}
+    
+    def _get_weather_context(self, grid_data):
+        """Get weather context (for solar availability prediction)."""
+        latest_weather = grid_data.get('weather')
+        if latest_weather:
+            return {
+                'temperature': latest_weather.value,
+                'cloud_cover': latest_weather.metadata.get('cloud_cover', 0),
+                'condition': latest_weather.metadata.get('weather_condition', 'Unknown'),
+                'timestamp': latest_weather.timestamp.isoformat(),
+            }
         
         return None
     
-    def _get_carbon_intensity(self):
+    def _get_carbon_intensity(self, grid_data):
         """Get current grid carbon intensity."""
-        try:
-            latest_carbon = GridData.objects.filter(
-                data_type='carbon_intensity'
-            ).order_by('-timestamp').first()
-            
-            if latest_carbon:
-                return {
-                    'value': latest_carbon.value,
-                    'unit': latest_carbon.unit,
-                    'timestamp': latest_carbon.timestamp.isoformat(),
-                }
-        except Exception as e:
-            logger.error(f"Error getting carbon intensity: {e}")
+        latest_carbon = grid_data.get('carbon_intensity')
+        if latest_carbon:
+            return {
+                'value': latest_carbon.value,
+                'unit': latest_carbon.unit,
+                'timestamp': latest_carbon.timestamp.isoformat(),
+            }
         
         return None
     
     def _get_sensor_data(self):
-        """Get recent sensor readings."""
+        """Get recent sensor readings (latest reading per sensor type)."""
         sensors = {}
         
-        # Get latest reading for each sensor type
         sensor_types = ['ldr', 'current', 'temperature', 'humidity']
-        for sensor_type in sensor_types:
-            try:
-                latest = SensorReading.objects.filter(
-                    sensor_type=sensor_type
-                ).order_by('-timestamp').first()
-                
-                if latest:
-                    sensors[sensor_type] = {
-                        'value': latest.value,
-                        'unit': latest.unit,
-                        'timestamp': latest.timestamp.isoformat(),
-                    }
-            except Exception as e:
-                logger.error(f"Error getting {sensor_type} data: {e}")
+        try:
+            latest_readings = SensorReading.objects.filter(
+                sensor_type__in=sensor_types
+            ).latest_per('sensor_type').only('sensor_type', 'value', 'unit', 'timestamp')
+            
+            for latest in latest_readings:
+                sensors[latest.sensor_type] = {
+                    'value': latest.value,
+                    'unit': latest.unit,
+                    'timestamp': latest.timestamp.isoformat(),
+                }
+        except Exception as e:
+            logger.error(f"Error getting sensor data: {e}")
         
         return sensors
     
@@ -288,23 +314,20 @@ class EnergySourceOptimizer:
     
     def _record_decision(self, recommendation):
         """Record the energy optimization decision."""
-        try:
-            AIDecision.objects.create(
-                decision_type='power_source',
-                decision={
-                    'recommended_source': recommendation['recommended_source'],
-                    'load_name': recommendation.get('load_name'),
-                    'load_priority': recommendation.get('load_priority'),
-                    'load_power': recommendation.get('load_power'),
-                    'scores': recommendation.get('scores', {}),
-                    'algorithm': recommendation.get('algorithm', 'rule_based'),
-                },
-                confidence=recommendation.get('confidence', 0.5),
-                reasoning=recommendation['reasoning'],
-                applied=False,  # Module 1 (Hardware) will set this to True when applied
-            )
-        except Exception as e:
-            logger.error(f"Error recording decision: {e}")
+        record_decision(
+            decision_type='power_source',
+            decision={
+                'recommended_source': recommendation['recommended_source'],
+                'load_name': recommendation.get('load_name'),
+                'load_priority': recommendation.get('load_priority'),
+                'load_power': recommendation.get('load_power'),
+                'scores': recommendation.get('scores', {}),
+                'algorithm': recommendation.get('algorithm', 'rule_based'),
+            },
+            confidence=recommendation.get('confidence', 0.5),
+            reasoning=recommendation['reasoning'],
+            applied=False,  # Module 1 (Hardware) will set this to True when applied
+        )
     
     def get_optimal_source_distribution(self):
         """
@@ -316,14 +339,16 @@ class EnergySourceOptimizer:
         Returns:
             dict: Distribution plan with sources and assigned loads
         """
-        context = self.gather_context()
+        # Only the energy source list is needed here, so skip the full
+        # gather_context() (weather, carbon, sensors, preferences)
+        energy_sources = self._get_energy_source_status()
         
         # For now, return simple recommendations
         # Module 3 will implement sophisticated optimization here
         
         distribution = {
-            'timestamp': context['timestamp'],
-            'available_sources': list(context['energy_sources'].keys()),
+            'timestamp': timezone.now().isoformat(),
+            'available_sources': list(energy_sources.keys()),
             'recommendations': [
                 {
                     'load_category': 'HVAC',
@@ -393,3 +418,9 @@ class EnergySourceOptimizer:
             'reasoning': 'Improvement not significant enough to justify switching',
             'score_difference': recommended_score - current_score,
         }
+
+
+@functools.lru_cache(maxsize=1)
+def get_energy_optimizer():
+    """Return the process-wide EnergySourceOptimizer."""
+    return EnergySourceOptimizer()
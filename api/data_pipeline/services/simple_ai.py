@@ -5,19 +5,130 @@ Provides energy demand forecasting and source optimization
 """
 
 import os
+import atexit
+import functools
 import json
+import logging
 import math
-import random
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
+import numpy as np
 from django.conf import settings
 from django.utils import timezone
 
 try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
+    import paho.mqtt.client as mqtt
+    MQTT_AVAILABLE = True
 except ImportError:
-    PANDAS_AVAILABLE = False
+    MQTT_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+logger = logging.getLogger(__name__)
+
+
+@njit(cache=True, fastmath=True)
+def _allocate(power_needed, available, costs, carbons):
+    """
+    Greedy allocation of power_needed (kW) across sources in priority order
+    available/costs/carbons are equal-length float tuples, highest priority first
+    Pure numeric code so Numba can compile it in nopython mode
+    
+    Returns:
+        (used kW per source as an array, total cost, total carbon)
+    """
+    used = np.zeros(len(available))
+    remaining = power_needed
+    cost = 0.0
+    carbon = 0.0
+    
+    for i in range(len(available)):
+        if remaining <= 0:
+            break
+        amount = min(available[i], remaining)
+        if amount > 0:
+            used[i] = amount
+            remaining -= amount
+            cost += amount * costs[i]
+            carbon += amount * carbons[i]
+    
+    return used, cost, carbon
+
+
+if NUMBA_AVAILABLE:
+    # Compile at import time so the first decision doesn't pay the JIT cost
+    _allocate(1.0, (0.5, 0.5, 1.0), (0.05, 0.10, 6.0), (50.0, 100.0, 500.0))
+
+
+# Display rounding for the non-negative kW/cost/carbon values in optimizer output.
+# Plain multiply/truncate (round half up) avoids the slower round() protocol.
+def _round1(x: float) -> float:
+    return int(x * 10 + 0.5) / 10.0
+
+
+def _round2(x: float) -> float:
+    return int(x * 100 + 0.5) / 100.0
+
+
+def _round3(x: float) -> float:
+    return int(x * 1000 + 0.5) / 1000.0
+
+
+def _dumps_payload(payload: Dict):
+    """Serialize an MQTT payload (bytes via orjson when installed, else stdlib str)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload)
+
+
+# Persistent MQTT client shared by all decisions in this process
+_mqtt_client = None
+_mqtt_lock = threading.Lock()
+
+
+def _get_mqtt_client():
+    """
+    Return the process-wide MQTT client, connecting on first use
+    The client's network loop runs in a background thread and reconnects on its own
+    """
+    global _mqtt_client
+    
+    with _mqtt_lock:
+        if _mqtt_client is None:
+            client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+            if settings.MQTT_USERNAME:
+                client.username_pw_set(settings.MQTT_USERNAME, settings.MQTT_PASSWORD)
+            client.connect(settings.MQTT_BROKER_HOST, settings.MQTT_BROKER_PORT, keepalive=60)
+            client.loop_start()
+            _mqtt_client = client
+    
+    return _mqtt_client
+
+
+@atexit.register
+def _close_mqtt_client():
+    """Disconnect the shared MQTT client on interpreter exit"""
+    if _mqtt_client is not None:
+        _mqtt_client.disconnect()
+        _mqtt_client.loop_stop()
 
 
 class SimpleEnergyForecaster:
@@ -37,47 +148,64 @@ class SimpleEnergyForecaster:
     # Peak hours definition
     PEAK_HOURS = [7, 8, 9, 17, 18, 19, 20]
     
+    # Array forms of the above, indexed by hour of day (0-23)
+    HOURLY_PATTERNS_ARR = np.array([kwh for _, kwh in sorted(HOURLY_PATTERNS.items())])
+    PEAK_MASK = np.isin(np.arange(24), PEAK_HOURS)
+    
     def __init__(self):
         self.model_ready = True
     
-    def forecast(self, hours_ahead: int = 6) -> List[Dict]:
+    def forecast(self, hours_ahead: int = 6, now: Optional[datetime] = None) -> List[Dict]:
         """
         Forecast energy demand for next N hours
         Returns list of predictions with timestamps
         """
-        predictions = []
-        now = timezone.now()
-        
-        for i in range(hours_ahead):
-            future_time = now + timedelta(hours=i + 1)
-            hour = future_time.hour
-            
-            # Base demand from pattern
-            base_demand = self.HOURLY_PATTERNS.get(hour, 1.0)
-            
-            # Add some variation (±15%) - deterministic based on time
-            random.seed(int(future_time.timestamp()) % 100)
-            variation = random.uniform(0.85, 1.15)
-            
-            predicted_kwh = round(base_demand * variation, 3)
-            is_peak = hour in self.PEAK_HOURS
-            
-            predictions.append({
-                'hour': i + 1,
-                'predicted_kwh': predicted_kwh,
-                'timestamp': future_time.isoformat(),
+        if now is None:
+            now = timezone.now()
+        
+        offsets = np.arange(1, hours_ahead + 1)
+        hours = (now.hour + offsets) % 24
+        
+        # Base demand from pattern
+        base_demand = self.HOURLY_PATTERNS_ARR[hours]
+        
+        # Add some variation (±15%) - deterministic based on time.
+        # Multiplicative hash of each forecast timestamp: no RNG state to seed or share
+        timestamps = (int(now.timestamp()) + offsets * 3600).astype(np.uint64)
+        hashed = (timestamps * np.uint64(2654435761)) & np.uint64(0xFFFFFF)
+        variation = 0.85 + 0.30 * hashed / 0xFFFFFF
+        
+        predicted_kwh = np.round(base_demand * variation, 3)
+        is_peak = self.PEAK_MASK[hours]
+        demand_level = np.select(
+            [predicted_kwh > 1.5, predicted_kwh > 0.8], ['high', 'medium'], default='low'
+        )
+        
+        predictions = [
+            {
+                'hour': offset,
+                'predicted_kwh': kwh,
+                'timestamp': (now + timedelta(hours=offset)).isoformat(),
                 'hour_of_day': hour,
-                'is_peak_hour': is_peak,
-                'demand_level': 'high' if predicted_kwh > 1.5 else ('medium' if predicted_kwh > 0.8 else 'low')
-            })
+                'is_peak_hour': peak,
+                'demand_level': level
+            }
+            for offset, kwh, hour, peak, level in zip(
+                offsets.tolist(), predicted_kwh.tolist(), hours.tolist(),
+                is_peak.tolist(), demand_level.tolist()
+            )
+        ]
         
         return predictions
     
-    def identify_peak_hours(self, hours_ahead: int = 24) -> Dict:
+    def identify_peak_hours(self, hours_ahead: int = 24, now: Optional[datetime] = None,
+                            forecast: Optional[List[Dict]] = None) -> Dict:
         """
         Identify upcoming peak hours in the forecast period
+        Pass an already computed `forecast` to avoid forecasting twice
         """
-        forecast = self.forecast(hours_ahead)
+        if forecast is None:
+            forecast = self.forecast(hours_ahead, now=now)
         
         peak_hours = [p for p in forecast if p['is_peak_hour']]
         high_demand_hours = [p for p in forecast if p['predicted_kwh'] > 1.5]
@@ -98,12 +226,67 @@ class SimpleEnergyForecaster:
         return f"Peak hour coming at {next_peak['hour_of_day']}:00. Consider deferring heavy loads or switching to battery/solar."
 
 
+# Recommendation message parts
+PRIMARY_SOURCE_MESSAGES = {
+    'solar': "☀️ Using solar power (cleanest option)",
+    'battery': "🔋 Using battery power (avoiding grid)",
+    'grid': "⚡ Using grid power",
+}
+BATTERY_LOW_MESSAGE = "⚠️ Battery low - consider charging"
+BATTERY_HIGH_MESSAGE = "✓ Battery well charged"
+PEAK_HOUR_MESSAGE = "📈 Peak hour - optimize consumption"
+
+# Battery states used to index the recommendation table
+BATTERY_LOW, BATTERY_NORMAL, BATTERY_HIGH = 0, 1, 2
+_BATTERY_STATE_MESSAGES = {
+    BATTERY_LOW: BATTERY_LOW_MESSAGE,
+    BATTERY_NORMAL: None,
+    BATTERY_HIGH: BATTERY_HIGH_MESSAGE,
+}
+
+# Every (primary_source, battery_state, is_peak) recommendation, joined once at import
+RECOMMENDATION_TEMPLATES = {
+    (primary, battery_state, is_peak): " | ".join(
+        part for part in (
+            primary_message,
+            battery_message,
+            PEAK_HOUR_MESSAGE if is_peak else None,
+        ) if part
+    )
+    for primary, primary_message in PRIMARY_SOURCE_MESSAGES.items()
+    for battery_state, battery_message in _BATTERY_STATE_MESSAGES.items()
+    for is_peak in (0, 1)
+}
+
+
 class SimpleSourceOptimizer:
     """
     Simple energy source optimizer
     Decides between Solar, Battery, and Grid based on conditions
     """
     
+    __slots__ = (
+        'solar_capacity', 'battery_capacity', 'battery_max_discharge', 'battery_charge',
+        '_cost_solar', '_cost_battery', '_cost_grid',
+        '_carbon_solar', '_carbon_battery', '_carbon_grid',
+    )
+    
+    # Sources in allocation priority order (cleanest and cheapest first)
+    SOURCE_PRIORITY = ('solar', 'battery', 'grid')
+    
+    # Evening peak hours (battery preferred over grid)
+    EVENING_PEAK_HOURS = frozenset({17, 18, 19, 20})
+    # Same hours as a 24-bit mask: bit h is set for each peak hour h
+    EVENING_PEAK_MASK = sum(1 << h for h in EVENING_PEAK_HOURS)
+    
+    # Time-of-day solar factor by hour (peak at noon, zero at night)
+    HOUR_FACTOR = tuple(
+        (1.0 - abs(h - 12) / 6.0) if 6 <= h < 18 else 0.0
+        for h in range(24)
+    )
+    # Converts LDR readings (0-4095) to a 0-1 solar fraction
+    LDR_SCALE = 1.0 / 4095.0
+    
     def __init__(self, 
                  solar_capacity: float = 3.0,
                  battery_capacity: float = 10.0,
@@ -114,36 +297,54 @@ class SimpleSourceOptimizer:
         self.battery_charge = battery_capacity * 0.7  # Start at 70%
         
         # Cost per kWh
-        self.costs = {
-            'solar': 0.05,   # Nearly free (maintenance only)
-            'battery': 0.10, # Battery degradation cost
-            'grid': 6.00     # Grid electricity price
-        }
+        self._cost_solar = 0.05     # Nearly free (maintenance only)
+        self._cost_battery = 0.10   # Battery degradation cost
+        self._cost_grid = 6.00      # Grid electricity price
         
         # Carbon intensity (gCO2/kWh)
-        self.carbon = {
-            'solar': 50,     # Manufacturing amortized
-            'battery': 100,  # Depends on charging source
-            'grid': 500      # Average grid carbon
-        }
+        self._carbon_solar = 50.0     # Manufacturing amortized
+        self._carbon_battery = 100.0  # Depends on charging source
+        self._carbon_grid = 500.0     # Average grid carbon
+    
+    @property
+    def costs(self) -> Dict[str, float]:
+        """Cost per kWh by source"""
+        return {'solar': self._cost_solar, 'battery': self._cost_battery, 'grid': self._cost_grid}
+    
+    @property
+    def carbon(self) -> Dict[str, float]:
+        """Carbon intensity (gCO2/kWh) by source"""
+        return {'solar': self._carbon_solar, 'battery': self._carbon_battery, 'grid': self._carbon_grid}
     
     def calculate_solar_available(self, ldr_value: float, hour: int) -> float:
         """
         Calculate available solar power based on LDR sensor and time
         LDR values: 0-4095 (higher = more light)
         """
-        # Night time - no solar
-        if hour < 6 or hour >= 18:
+        # Time-of-day factor (peak at noon); night time - no solar
+        hour_factor = self.HOUR_FACTOR[hour]
+        if hour_factor == 0.0:
             return 0.0
         
         # Convert LDR (0-4095) to solar fraction (0-1)
-        solar_fraction = min(1.0, max(0.0, ldr_value / 4095.0))
-        
-        # Apply time-of-day factor (peak at noon)
-        hour_factor = 1.0 - abs(hour - 12) / 6.0
+        solar_fraction = min(1.0, max(0.0, ldr_value * self.LDR_SCALE))
         
         return self.solar_capacity * solar_fraction * hour_factor
     
+    def calculate_solar_available_vec(self, ldr_values, hours) -> np.ndarray:
+        """
+        Vectorized calculate_solar_available for planning over many hours at once
+        Accepts array-likes of LDR values and hours (broadcastable)
+        """
+        ldr_values = np.asarray(ldr_values, dtype=float)
+        hours = np.asarray(hours)
+        
+        solar_fraction = np.clip(ldr_values / 4095.0, 0.0, 1.0)
+        hour_factor = np.clip(1.0 - np.abs(hours - 12) / 6.0, 0.0, None)
+        night = (hours < 6) | (hours >= 18)
+        
+        return np.where(night, 0.0, self.solar_capacity * solar_fraction * hour_factor)
+    
     def optimize_source(self, 
                        power_needed: float,
                        conditions: Dict) -> Tuple[List[Tuple[str, float]], Dict]:
@@ -157,7 +358,9 @@ class SimpleSourceOptimizer:
         Returns:
             (source_allocation, metrics)
         """
-        hour = conditions.get('hour', timezone.now().hour)
+        hour = conditions.get('hour')
+        if hour is None:
+            hour = timezone.now().hour
         ldr = conditions.get('ldr', 0)
         carbon_intensity = conditions.get('carbon_intensity', 500)
         grid_price = conditions.get('grid_price', 6.0)
@@ -166,36 +369,32 @@ class SimpleSourceOptimizer:
         solar_available = self.calculate_solar_available(ldr, hour)
         battery_available = min(self.battery_max_discharge, self.battery_charge * 0.8)
         
-        allocation = []
-        remaining = power_needed
-        total_cost = 0
-        total_carbon = 0
-        
-        # Priority 1: Use solar (cleanest and cheapest)
-        if solar_available > 0 and remaining > 0:
-            solar_used = min(solar_available, remaining)
-            allocation.append(('solar', round(solar_used, 3)))
-            remaining -= solar_used
-            total_cost += solar_used * self.costs['solar']
-            total_carbon += solar_used * self.carbon['solar']
-        
-        # Priority 2: Use battery if grid carbon is high
-        if remaining > 0 and battery_available > 0:
-            # Use battery if grid carbon is high or during peak hours
-            if carbon_intensity > 400 or hour in [17, 18, 19, 20]:
-                battery_used = min(battery_available, remaining)
-                allocation.append(('battery', round(battery_used, 3)))
-                remaining -= battery_used
-                # Ensure battery charge never goes below zero
-                self.battery_charge = max(0, self.battery_charge - battery_used)
-                total_cost += battery_used * self.costs['battery']
-                total_carbon += battery_used * self.carbon['battery']
-        
-        # Priority 3: Use grid for remaining
-        if remaining > 0:
-            allocation.append(('grid', round(remaining, 3)))
-            total_cost += remaining * grid_price
-            total_carbon += remaining * carbon_intensity
+        # Use battery only if grid carbon is high or during peak hours
+        use_battery = carbon_intensity > 400 or (self.EVENING_PEAK_MASK >> hour) & 1
+        
+        # Priority table in SOURCE_PRIORITY order; the grid covers whatever remains
+        demand = float(power_needed)
+        available = (
+            float(solar_available),
+            float(battery_available) if use_battery else 0.0,
+            demand,
+        )
+        costs = (self._cost_solar, self._cost_battery, float(grid_price))
+        carbons = (self._carbon_solar, self._carbon_battery, float(carbon_intensity))
+        
+        used, total_cost, total_carbon = _allocate(demand, available, costs, carbons)
+        used = used.tolist()
+        
+        allocation = [
+            (source, _round3(amount))
+            for source, amount in zip(self.SOURCE_PRIORITY, used)
+            if amount > 0
+        ]
+        
+        # Ensure battery charge never goes below zero
+        battery_used = used[1]
+        if battery_used > 0:
+            self.battery_charge = max(0, self.battery_charge - battery_used)
         
         # Recharge battery from excess solar
         if solar_available > power_needed:
@@ -206,12 +405,12 @@ class SimpleSourceOptimizer:
         
         metrics = {
             'total_power': power_needed,
-            'solar_available': round(solar_available, 3),
-            'battery_available': round(battery_available, 3),
-            'battery_charge': round(self.battery_charge, 2),
-            'battery_percentage': round((self.battery_charge / self.battery_capacity) * 100, 1),
-            'cost': round(total_cost, 2),
-            'carbon': round(total_carbon, 1),
+            'solar_available': _round3(solar_available),
+            'battery_available': _round3(battery_available),
+            'battery_charge': _round2(self.battery_charge),
+            'battery_percentage': _round1((self.battery_charge / self.battery_capacity) * 100),
+            'cost': _round2(total_cost),
+            'carbon': _round1(total_carbon),
             'primary_source': allocation[0][0] if allocation else 'grid'
         }
         
@@ -219,29 +418,22 @@ class SimpleSourceOptimizer:
     
     def get_recommendation(self, allocation: List[Tuple[str, float]], 
                           metrics: Dict, conditions: Dict) -> str:
-        """Generate human-readable recommendation"""
-        parts = []
-        
+        """Generate human-readable recommendation (lookup into precomputed templates)"""
         primary = metrics.get('primary_source', 'grid')
-        
-        if primary == 'solar':
-            parts.append("☀️ Using solar power (cleanest option)")
-        elif primary == 'battery':
-            parts.append("🔋 Using battery power (avoiding grid)")
-        else:
-            parts.append("⚡ Using grid power")
+        if primary not in PRIMARY_SOURCE_MESSAGES:
+            primary = 'grid'
         
         battery_pct = metrics.get('battery_percentage', 0)
         if battery_pct < 20:
-            parts.append("⚠️ Battery low - consider charging")
+            battery_state = BATTERY_LOW
         elif battery_pct > 80:
-            parts.append("✓ Battery well charged")
+            battery_state = BATTERY_HIGH
+        else:
+            battery_state = BATTERY_NORMAL
         
-        hour = conditions.get('hour', 12)
-        if hour in [17, 18, 19, 20]:
-            parts.append("📈 Peak hour - optimize consumption")
+        is_peak = (self.EVENING_PEAK_MASK >> conditions.get('hour', 12)) & 1
         
-        return " | ".join(parts)
+        return RECOMMENDATION_TEMPLATES[(primary, battery_state, is_peak)]
 
 
 class SimpleAIService:
@@ -249,49 +441,66 @@ class SimpleAIService:
     Main AI Service combining forecasting and optimization
     """
     
+    # Seconds to reuse conditions read from the database
+    CONDITIONS_TTL = 5.0
+    
+    # Seconds to reuse a forecast, and the horizon it is computed for; shorter
+    # horizons are a prefix of the longest one
+    FORECAST_TTL = 60.0
+    FORECAST_MAX_HOURS = 48
+    
     def __init__(self):
         self.forecaster = SimpleEnergyForecaster()
         self.optimizer = SimpleSourceOptimizer()
         self.models_loaded = True  # Always ready
+        self._cond_cache = (None, 0.0)  # (conditions, monotonic time read)
+        self._forecast_cache = (None, None, 0.0)  # (now, predictions, monotonic time computed)
+        # The optimizer's simulated battery is shared state; serialize updates
+        self._lock = threading.Lock()
     
     def is_available(self) -> bool:
         return True
     
-    def get_conditions(self) -> Dict:
-        """Get current conditions from database"""
-        return self._read_from_database()
+    def get_conditions(self, now: Optional[datetime] = None) -> Dict:
+        """Get current conditions from database (cached for CONDITIONS_TTL seconds)"""
+        conditions, read_at = self._cond_cache
+        if conditions is None or time.monotonic() - read_at >= self.CONDITIONS_TTL:
+            conditions = self._read_from_database(now)
+            self._cond_cache = (conditions, time.monotonic())
+        return dict(conditions)
     
-    def _read_from_database(self) -> Dict:
+    def _read_from_database(self, now: Optional[datetime] = None) -> Dict:
         """Read conditions from Django database"""
         from ..models import SensorReading, GridData
         
-        conditions = self._get_defaults()
+        conditions = self._get_defaults(now)
         conditions['source'] = 'database'
         
         try:
-            # Get latest sensor readings
-            for sensor_type in ['temperature', 'humidity', 'ldr', 'current', 'voltage']:
-                reading = SensorReading.objects.filter(
-                    sensor_type=sensor_type
-                ).order_by('-timestamp').first()
-                if reading:
-                    conditions[sensor_type] = float(reading.value)
+            # Get latest sensor readings (one row per sensor type, single query)
+            latest_readings = SensorReading.objects.filter(
+                sensor_type__in=['temperature', 'humidity', 'ldr', 'current', 'voltage']
+            ).latest_per('sensor_type').values_list('sensor_type', 'value')
+            for sensor_type, value in latest_readings:
+                conditions[sensor_type] = float(value)
             
-            # Get latest carbon intensity
+            # Get latest carbon intensity (value column only)
             carbon = GridData.objects.filter(
                 data_type='carbon_intensity'
-            ).order_by('-timestamp').first()
-            if carbon:
-                conditions['carbon_intensity'] = float(carbon.value)
-        except Exception as e:
-            print(f"Database read error: {e}")
+            ).order_by('-timestamp').values_list('value', flat=True).first()
+            if carbon is not None:
+                conditions['carbon_intensity'] = float(carbon)
+        except Exception:
+            logger.exception("Database read error")
         
         return conditions
     
-    def _get_defaults(self) -> Dict:
+    def _get_defaults(self, now: Optional[datetime] = None) -> Dict:
         """Default conditions when all else fails"""
+        if now is None:
+            now = timezone.now()
         return {
-            'hour': timezone.now().hour,
+            'hour': now.hour,
             'temperature': 25.0,
             'humidity': 50.0,
             'ldr': 2000,
@@ -302,13 +511,30 @@ class SimpleAIService:
             'source': 'defaults'
         }
     
-    def forecast_demand(self, hours_ahead: int = 6) -> Dict:
-        """Forecast energy demand"""
-        predictions = self.forecaster.forecast(hours_ahead)
-        peak_info = self.forecaster.identify_peak_hours(hours_ahead)
+    def _cached_forecast(self, hours_ahead: int) -> Tuple[datetime, List[Dict]]:
+        """Forecast as of up to FORECAST_TTL seconds ago, shared by every horizon"""
+        now, predictions, computed_at = self._forecast_cache
+        if predictions is None or time.monotonic() - computed_at >= self.FORECAST_TTL:
+            now = timezone.now()
+            predictions = self.forecaster.forecast(self.FORECAST_MAX_HOURS, now=now)
+            self._forecast_cache = (now, predictions, time.monotonic())
+        return now, predictions[:hours_ahead]
+    
+    def forecast_demand(self, hours_ahead: int = 6, now: Optional[datetime] = None) -> Dict:
+        """
+        Forecast energy demand
+        Without an explicit `now`, reuses the forecast cached for FORECAST_TTL seconds
+        """
+        if now is None and hours_ahead <= self.FORECAST_MAX_HOURS:
+            now, predictions = self._cached_forecast(hours_ahead)
+        else:
+            if now is None:
+                now = timezone.now()
+            predictions = self.forecaster.forecast(hours_ahead, now=now)
+        peak_info = self.forecaster.identify_peak_hours(forecast=predictions)
         
         return {
-            'timestamp': timezone.now().isoformat(),
+            'timestamp': now.isoformat(),
             'forecast_horizon': hours_ahead,
             'predictions': predictions,
             'peak_hours': peak_info['peak_hours'],
@@ -322,14 +548,16 @@ class SimpleAIService:
                         load_priority: int = 50,
                         load_power: float = 1000) -> Dict:
         """Recommend energy source for a load"""
-        conditions = self.get_conditions()
+        now = timezone.now()
+        conditions = self.get_conditions(now=now)
         power_kw = load_power / 1000.0
         
-        allocation, metrics = self.optimizer.optimize_source(power_kw, conditions)
+        with self._lock:
+            allocation, metrics = self.optimizer.optimize_source(power_kw, conditions)
         recommendation = self.optimizer.get_recommendation(allocation, metrics, conditions)
         
         return {
-            'timestamp': timezone.now().isoformat(),
+            'timestamp': now.isoformat(),
             'load_name': load_name,
             'load_priority': load_priority,
             'load_power': load_power,
@@ -351,22 +579,26 @@ class SimpleAIService:
     
     def make_decision(self) -> Dict:
         """Make comprehensive energy management decision"""
+        # Read the clock once for the whole decision
+        now = timezone.now()
+        
         # Get forecast
-        forecast_result = self.forecast_demand(6)
+        forecast_result = self.forecast_demand(6, now=now)
         
         # Get current conditions
-        conditions = self.get_conditions()
+        conditions = self.get_conditions(now=now)
         
         # Get predicted demand for next hour
         next_hour_demand = forecast_result['predictions'][0]['predicted_kwh']
         
         # Optimize source allocation
-        allocation, metrics = self.optimizer.optimize_source(next_hour_demand, conditions)
+        with self._lock:
+            allocation, metrics = self.optimizer.optimize_source(next_hour_demand, conditions)
         recommendation = self.optimizer.get_recommendation(allocation, metrics, conditions)
         
         # Build decision
         decision = {
-            'timestamp': timezone.now().isoformat(),
+            'timestamp': forecast_result['timestamp'],
             'forecast': forecast_result['predictions'],
             'peak_hours': forecast_result['peak_hours'],
             'current_conditions': conditions,
@@ -391,9 +623,11 @@ class SimpleAIService:
     
     def _publish_decision(self, decision: Dict):
         """Publish decision to MQTT for hardware"""
+        if not MQTT_AVAILABLE:
+            logger.debug("paho-mqtt not installed; skipping decision publish")
+            return
+        
         try:
-            import paho.mqtt.publish as publish
-            
             payload = {
                 'command': 'switch_source',
                 'source': decision['current_decision']['primary_source'],
@@ -401,19 +635,23 @@ class SimpleAIService:
                 'timestamp': decision['timestamp']
             }
             
-            publish.single(
-                "HyperVolt/commands/control",
-                payload=json.dumps(payload),
-                hostname="localhost",
-                port=1883
+            info = _get_mqtt_client().publish(
+                f"{settings.MQTT_TOPIC_PREFIX}/commands/control",
+                payload=_dumps_payload(payload),
+                qos=0
             )
-            print(f"✓ Published AI decision to MQTT: {payload['source']}")
+            if info.rc != 0:
+                # Connected once but currently offline; the client loop keeps reconnecting
+                logger.warning("MQTT publish failed (rc=%s)", info.rc)
+                return
+            logger.debug("Published AI decision to MQTT: %s", payload['source'])
         except Exception as e:
-            print(f"MQTT publish failed (expected if broker not running): {e}")
+            logger.warning("MQTT publish failed (expected if broker not running): %s", e)
     
     def get_status(self) -> Dict:
         """Get AI service status"""
-        conditions = self.get_conditions()
+        now = timezone.now()
+        conditions = self.get_conditions(now=now)
         
         return {
             'available': True,
@@ -431,5 +669,16 @@ class SimpleAIService:
                 'capacity': self.optimizer.battery_capacity
             },
             'solar_capacity': self.optimizer.solar_capacity,
-            'timestamp': timezone.now().isoformat()
+            'timestamp': now.isoformat()
         }
+
+
+@functools.lru_cache(maxsize=1)
+def get_ai_service() -> SimpleAIService:
+    """
+    Return the process-wide SimpleAIService.
+
+    Sharing one instance keeps the conditions cache warm and lets the simulated
+    battery carry its charge from one decision to the next.
+    """
+    return SimpleAIService()
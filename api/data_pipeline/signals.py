@@ -0,0 +1,76 @@
+"""
+Signal handlers for keeping cached data in sync with the database.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import EnergySource, GridData, LatestSensorReading, SensorReading, UserPreferences
+from .response_cache import (
+    AVAILABLE_SOURCES_CACHE_KEY,
+    clear_preference_cache,
+    grid_latest_key,
+    sensor_latest_key,
+)
+from .services.energy_optimizer import ENERGY_SOURCES_CACHE_KEY
+
+
+@receiver(post_save, sender=EnergySource)
+@receiver(post_delete, sender=EnergySource)
+def invalidate_energy_sources(sender, **kwargs):
+    """Drop the cached energy source status whenever a source changes."""
+    cache.delete_many([ENERGY_SOURCES_CACHE_KEY, AVAILABLE_SOURCES_CACHE_KEY])
+
+
+@receiver(post_save, sender=SensorReading)
+def update_latest_sensor_reading(sender, instance, **kwargs):
+    """Roll the sensor's summary row forward unless it already holds a newer reading."""
+    fields = {
+        'value': instance.value,
+        'unit': instance.unit,
+        'location': instance.location,
+        'timestamp': instance.timestamp,
+        'reading_id': instance.pk,
+        'reading_created_at': instance.created_at,
+    }
+    sensor = {'sensor_type': instance.sensor_type, 'sensor_id': instance.sensor_id}
+    stale_row = LatestSensorReading.objects.filter(timestamp__lte=instance.timestamp, **sensor)
+    if stale_row.update(**fields):
+        return
+
+    _, created = LatestSensorReading.objects.get_or_create(defaults=fields, **sensor)
+    if not created:
+        # Another reading created the row between our update and insert (or it
+        # already held a newer one); re-apply the guarded update so the newest wins
+        stale_row.update(**fields)
+
+
+@receiver(post_save, sender=SensorReading)
+def invalidate_sensor_latest(sender, instance, **kwargs):
+    """Drop every cached 'latest' response the reading could appear in."""
+    cache.delete_many([
+        sensor_latest_key(),
+        sensor_latest_key(sensor_type=instance.sensor_type),
+        sensor_latest_key(sensor_id=instance.sensor_id),
+        sensor_latest_key(instance.sensor_type, instance.sensor_id),
+    ])
+
+
+# No post_delete handlers for the time-series models: a delete listener stops
+# Django from fast-deleting, so cleanup_old_data would load every expired row.
+@receiver(post_save, sender=GridData)
+def invalidate_grid_latest(sender, instance, **kwargs):
+    """
+    Drop the cached 'latest' responses for the row's data type.
+
+    Covers rows saved one at a time (admin, API); the fetch tasks insert with
+    bulk_create, which sends no signal, so flush_grid_data invalidates itself.
+    """
+    cache.delete_many([grid_latest_key(), grid_latest_key(instance.data_type)])
+
+
+@receiver(post_save, sender=UserPreferences)
+@receiver(post_delete, sender=UserPreferences)
+def invalidate_preferences(sender, **kwargs):
+    """Drop locally cached preferences whenever one changes."""
+    clear_preference_cache()
@@ -2,19 +2,81 @@
 Scheduled tasks for fetching external API data.
 These tasks run periodically via Django-Q to fetch carbon intensity and weather data.
 """
+import atexit
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.core.cache import cache
+from django.db import connections
 from django.utils import timezone
 
 from .models import GridData
+from .response_cache import grid_latest_key
 from .services import ElectricityMapsService, WeatherService
 
 logger = logging.getLogger(__name__)
 
+# GridData rows are queued by the fetch tasks and written with bulk_create
+# when a task finishes. Rows stay queued until a write succeeds, so a failed
+# insert is retried by the next flush instead of being lost.
+_PENDING_GRID_DATA = []
+_PENDING_LOCK = threading.Lock()
+_FLUSH_LOCK = threading.Lock()  # One writer at a time, so no row is inserted twice
 
-def fetch_carbon_intensity():
+
+def _queue_grid_data(grid_data):
+    """Queue an unsaved GridData row for the next flush."""
+    with _PENDING_LOCK:
+        _PENDING_GRID_DATA.append(grid_data)
+
+
+def flush_grid_data():
+    """
+    Write all queued GridData rows in a single bulk insert.
+
+    Failures are logged, not raised, so they never fail the task that happened
+    to flush; the rows stay queued for the next attempt. Also registered with
+    atexit so a stopping worker doesn't drop rows.
+
+    Returns:
+        int: Number of rows written
+    """
+    with _FLUSH_LOCK:
+        with _PENDING_LOCK:
+            pending = _PENDING_GRID_DATA[:]
+        
+        if not pending:
+            return 0
+        
+        try:
+            GridData.objects.bulk_create(pending, batch_size=500)
+        except Exception as e:
+            logger.error(f"Failed to flush {len(pending)} grid data entries, keeping them queued: {e}")
+            return 0
+        
+        # Rows queued while the insert ran sit after the snapshot
+        with _PENDING_LOCK:
+            del _PENDING_GRID_DATA[:len(pending)]
+    
+    # bulk_create sends no post_save, so drop the cached 'latest' responses here
+    data_types = {row.data_type for row in pending}
+    try:
+        cache.delete_many([grid_latest_key()] + [grid_latest_key(data_type) for data_type in data_types])
+    except Exception as e:
+        logger.warning(f"Could not invalidate cached grid data: {e}")
+    
+    logger.info(f"Flushed {len(pending)} grid data entries")
+    return len(pending)
+
+
+atexit.register(flush_grid_data)
+
+
+def fetch_carbon_intensity(flush=True):
     """
     Fetch current carbon intensity from Electricity Maps API.
     This task should be scheduled to run every 15-30 minutes.
+    Pass flush=False to leave the row queued for the caller to flush.
     """
     try:
         service = ElectricityMapsService()
@@ -26,7 +88,7 @@ def fetch_carbon_intensity():
             data = service.get_mock_carbon_intensity()
         
         # Save to database
-        grid_data = GridData.objects.create(
+        grid_data = GridData(
             data_type='carbon_intensity',
             value=data['carbon_intensity'],
             unit=data['unit'],
@@ -38,6 +100,10 @@ def fetch_carbon_intensity():
             timestamp=timezone.now()
         )
         
+        _queue_grid_data(grid_data)
+        if flush:
+            flush_grid_data()
+        
         logger.info(f"Saved carbon intensity: {grid_data}")
         return f"Successfully fetched carbon intensity: {data['carbon_intensity']} {data['unit']}"
         
@@ -46,10 +112,11 @@ def fetch_carbon_intensity():
         raise
 
 
-def fetch_weather_data():
+def fetch_weather_data(flush=True):
     """
     Fetch current weather data from OpenWeatherMap API.
     This task should be scheduled to run every 15-30 minutes.
+    Pass flush=False to leave the row queued for the caller to flush.
     """
     try:
         service = WeatherService()
@@ -61,7 +128,7 @@ def fetch_weather_data():
             data = service.get_mock_weather()
         
         # Save temperature
-        GridData.objects.create(
+        grid_data = GridData(
             data_type='weather',
             value=data['temperature'],
             unit='celsius',
@@ -74,6 +141,10 @@ def fetch_weather_data():
             timestamp=timezone.now()
         )
         
+        _queue_grid_data(grid_data)
+        if flush:
+            flush_grid_data()
+        
         logger.info(f"Saved weather data: {data['temperature']}°C, {data.get('description')}")
         return f"Successfully fetched weather: {data['temperature']}°C"
         
@@ -82,6 +153,35 @@ def fetch_weather_data():
         raise
 
 
+def _run_with_own_connection(func, **kwargs):
+    """Run a task in a worker thread, closing the thread's DB connections afterwards."""
+    try:
+        return func(**kwargs)
+    finally:
+        connections.close_all()
+
+
+def fetch_all_external():
+    """
+    Fetch carbon intensity and weather data concurrently.
+    Both fetches block on external HTTP calls, so running them in parallel
+    overlaps the network waits. Schedule this instead of the two separate tasks.
+    Both rows are written together in one bulk insert once the fetches finish.
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(_run_with_own_connection, fetch_carbon_intensity, flush=False),
+                executor.submit(_run_with_own_connection, fetch_weather_data, flush=False),
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        # Write whatever was queued, even if one of the fetches failed
+        flush_grid_data()
+    
+    return " | ".join(results)
+
+
 def cleanup_old_data():
     """
     Clean up old sensor and grid data to prevent database bloat.
@@ -94,13 +194,11 @@ def cleanup_old_data():
         
         cutoff_date = timezone.now() - timedelta(days=7)
         
-        # Delete old sensor readings
-        sensor_count = SensorReading.objects.filter(timestamp__lt=cutoff_date).count()
-        SensorReading.objects.filter(timestamp__lt=cutoff_date).delete()
+        # Delete old sensor readings (delete() returns the number of rows removed)
+        sensor_count, _ = SensorReading.objects.filter(timestamp__lt=cutoff_date).delete()
         
         # Delete old grid data
-        grid_count = GridData.objects.filter(timestamp__lt=cutoff_date).count()
-        GridData.objects.filter(timestamp__lt=cutoff_date).delete()
+        grid_count, _ = GridData.objects.filter(timestamp__lt=cutoff_date).delete()
         
         logger.info(f"Cleaned up {sensor_count} sensor readings and {grid_count} grid data entries")
         return f"Cleaned up {sensor_count} sensor readings and {grid_count} grid data entries"
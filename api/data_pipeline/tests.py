@@ -1,3 +1,163 @@
-from django.test import TestCase
+import queue
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from data_pipeline import tasks
+from data_pipeline.models import AIDecision, GridData, LatestSensorReading, SensorReading
+from data_pipeline.response_cache import grid_latest_key
+from data_pipeline.services import decision_writer
+
+
+def _decision(**overrides):
+    fields = {
+        'decision_type': 'power_source',
+        'decision': {'recommended_source': 'solar'},
+        'confidence': 0.8,
+        'reasoning': 'Solar covers the load',
+    }
+    fields.update(overrides)
+    return fields
+
+
+class DecisionWriterTests(TestCase):
+    """The background AIDecision writer, driven from the test thread."""
+
+    def setUp(self):
+        # Give each test its own queue and counters, and keep the real writer
+        # thread from starting and racing the test for queued rows
+        self._patch(decision_writer, '_decision_queue', queue.Queue(maxsize=decision_writer.DECISION_QUEUE_SIZE))
+        self._patch(decision_writer, '_ensure_writer', mock.Mock())
+        patcher = mock.patch.dict(decision_writer._stats, {'dropped': 0, 'failed': 0})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _patch(self, target, attribute, new):
+        patcher = mock.patch.object(target, attribute, new)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_flush_writes_every_queued_decision(self):
+        count = decision_writer.DECISION_BATCH_SIZE + 50
+        for _ in range(count):
+            decision_writer.record_decision(**_decision())
+
+        self.assertEqual(AIDecision.objects.count(), 0)
+        self.assertEqual(decision_writer.flush_decisions(), count)
+        self.assertEqual(AIDecision.objects.count(), count)
+        self.assertEqual(decision_writer.get_writer_stats()['queued'], 0)
+
+    def test_full_queue_drops_and_counts_decisions(self):
+        self._patch(decision_writer, '_decision_queue', queue.Queue(maxsize=2))
+
+        for _ in range(3):
+            decision_writer.record_decision(**_decision())
+
+        stats = decision_writer.get_writer_stats()
+        self.assertEqual(stats['queued'], 2)
+        self.assertEqual(stats['dropped'], 1)
+        decision_writer.flush_decisions()
+        self.assertEqual(AIDecision.objects.count(), 2)
+
+    def test_failed_write_is_counted_not_raised(self):
+        decision_writer.record_decision(**_decision())
+        decision_writer.record_decision(**_decision())
+
+        with mock.patch.object(AIDecision.objects, 'bulk_create', side_effect=DatabaseError('gone')):
+            decision_writer.flush_decisions()
+
+        self.assertEqual(decision_writer.get_writer_stats()['failed'], 2)
+        self.assertEqual(AIDecision.objects.count(), 0)
+
+    def test_writer_refreshes_connection_before_each_batch(self):
+        decision_writer.record_decision(**_decision())
+        decision_writer.record_decision(**_decision(decision_type='load_shift'))
+
+        calls = mock.Mock()
+        with mock.patch.object(decision_writer, 'close_old_connections', calls.close_old_connections), \
+                mock.patch.object(decision_writer, '_write', calls.write):
+            decision_writer._write_next()
+
+        self.assertEqual([name for name, _, _ in calls.mock_calls], ['close_old_connections', 'write'])
+        batch = calls.write.call_args.args[0]
+        self.assertEqual([row.decision_type for row in batch], ['power_source', 'load_shift'])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class GridDataFlushTests(TestCase):
+    """Queued GridData rows written by flush_grid_data."""
+
+    def setUp(self):
+        patcher = mock.patch.object(tasks, '_PENDING_GRID_DATA', [])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _queue(self, data_type='carbon_intensity'):
+        tasks._queue_grid_data(GridData(data_type=data_type, value=1.0, unit='raw'))
+
+    def test_flush_writes_every_queued_row(self):
+        self._queue()
+        self._queue('weather')
+
+        self.assertEqual(tasks.flush_grid_data(), 2)
+        self.assertEqual(GridData.objects.count(), 2)
+        self.assertEqual(tasks._PENDING_GRID_DATA, [])
+
+    def test_failed_flush_keeps_rows_for_the_next_attempt(self):
+        self._queue()
+
+        with mock.patch.object(GridData.objects, 'bulk_create', side_effect=DatabaseError('gone')):
+            self.assertEqual(tasks.flush_grid_data(), 0)
+        self.assertEqual(len(tasks._PENDING_GRID_DATA), 1)
+
+        self._queue('weather')
+        self.assertEqual(tasks.flush_grid_data(), 2)
+        self.assertEqual(GridData.objects.count(), 2)
+
+    def test_flush_invalidates_cached_latest_grid_data(self):
+        cache.set(grid_latest_key(), [], 60)
+        cache.set(grid_latest_key('weather'), [], 60)
+        self._queue('weather')
+
+        tasks.flush_grid_data()
+
+        self.assertIsNone(cache.get(grid_latest_key()))
+        self.assertIsNone(cache.get(grid_latest_key('weather')))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class LatestSensorReadingTests(TestCase):
+    """The per-sensor summary row kept by the post_save handler."""
+
+    def _save(self, value, timestamp):
+        return SensorReading.objects.create(sensor_type='ldr', sensor_id='ldr-1', value=value, timestamp=timestamp)
+
+    def test_older_reading_does_not_replace_newer(self):
+        now = timezone.now()
+        newest = self._save(2.0, now)
+        self._save(1.0, now - timedelta(minutes=1))
+
+        latest = LatestSensorReading.objects.get()
+        self.assertEqual((latest.value, latest.reading_id), (2.0, newest.pk))
+
+    def test_newest_reading_wins_a_first_insert_race(self):
+        now = timezone.now()
+        get_or_create = LatestSensorReading.objects.get_or_create
+
+        def concurrent_insert(**kwargs):
+            # An older first reading for the sensor lands between our UPDATE and INSERT
+            LatestSensorReading.objects.create(
+                sensor_type='ldr', sensor_id='ldr-1', value=1.0,
+                timestamp=now - timedelta(minutes=1), reading_id=0, reading_created_at=now,
+            )
+            return get_or_create(**kwargs)
+
+        with mock.patch.object(LatestSensorReading.objects, 'get_or_create', side_effect=concurrent_insert):
+            newest = self._save(2.0, now)
+
+        latest = LatestSensorReading.objects.get()
+        self.assertEqual((latest.value, latest.reading_id), (2.0, newest.pk))
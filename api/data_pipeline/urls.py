@@ -3,7 +3,7 @@ URL configuration for the data_pipeline app.
 """
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import async_views, views
 
 router = DefaultRouter()
 router.register(r'sensor-readings', views.SensorReadingViewSet, basename='sensor-reading')
@@ -19,5 +19,8 @@ router.register(r'ai', views.AIPredictionViewSet, basename='ai-prediction')
 app_name = 'data_pipeline'
 
 urlpatterns = [
+    # Async read paths for dashboard polling; must precede the router's detail routes
+    path('sensor-readings/latest/', async_views.sensor_latest, name='sensor-reading-latest'),
+    path('grid-data/latest/', async_views.grid_latest, name='grid-data-latest'),
     path('', include(router.urls)),
 ]
@@ -1,10 +1,20 @@
+import logging
+import time
+
 from django.shortcuts import render
-from rest_framework import viewsets, status
+from rest_framework import serializers, viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from django.db import transaction
+from django.db.models import Avg, Count, F, Max, Min
+from django.db.models.functions import TruncHour, TruncMinute
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control, cache_page
 from datetime import timedelta
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from .models import SensorReading
 from django.utils import timezone
 
@@ -18,10 +28,171 @@ from .serializers import (
     LoadSerializer,
     SourceSwitchEventSerializer
 )
-from .services.cache_manager import SensorBufferManager
-from .services.energy_optimizer import EnergySourceOptimizer
+from hypervolt_backend.renderers import dumps as json_dumps
+from .pagination import TimestampCursorPagination
+from .response_cache import (
+    AVAILABLE_SOURCES_CACHE_KEY,
+    POLLING_CACHE_TTL,
+    SENSOR_ALL_LATEST_CACHE_KEY,
+    cache_response,
+    decision_latest_key,
+    get_cached_preference,
+)
+from .services.cache_manager import get_buffer_manager
+from .services.decision_writer import get_writer_stats, record_decision
+from .services.energy_optimizer import get_energy_optimizer
 # Use simple AI service that works without TensorFlow
-from .services.simple_ai import SimpleAIService
+from .services.simple_ai import get_ai_service
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per database round-trip when streaming bulk exports
+STREAM_CHUNK_SIZE = 2000
+
+# Circuit breaker for hot path buffer reads: after this many consecutive cache
+# failures, skip the cache for the cooldown and answer with an empty buffer.
+BUFFER_BREAKER_THRESHOLD = 5
+BUFFER_BREAKER_COOLDOWN = 5.0  # seconds
+_buffer_breaker = {'open_until': 0.0, 'failures': 0}
+
+# Seconds to cache idempotent GET actions whose data moves on a sensor-tick timescale
+SHORT_CACHE_SECONDS = 5
+
+# Seconds to cache grid series; carbon intensity and weather are fetched from
+# external APIs every 15 minutes or more
+GRID_SERIES_CACHE_SECONDS = 60
+
+# Time bucket functions accepted by the `granularity` query param
+BUCKET_FUNCTIONS = {'minute': TruncMinute, 'hour': TruncHour}
+
+# Upper bound on the `hours` window accepted by time-window actions (30 days)
+MAX_WINDOW_HOURS = 720
+
+# Keys of decision['current_decision'] shown in the AI decision history, with
+# the value used when a decision doesn't have them
+HISTORY_SUMMARY_DEFAULTS = {
+    'primary_source': 'unknown',
+    'predicted_demand_kwh': 0,
+    'battery_percentage': 0,
+    'solar_available': 0,
+    'cost': 0,
+    'carbon': 0,
+}
+
+
+def _parse_int_param(request, name, default, max_value, strict=True):
+    """
+    Read an integer query param clamped to [1, max_value].
+
+    Invalid values raise a 400 when strict, otherwise fall back to default.
+    """
+    try:
+        value = int(request.query_params.get(name, default))
+    except (TypeError, ValueError):
+        if strict:
+            raise ValidationError({name: 'Must be an integer.'})
+        value = default
+    return max(1, min(value, max_value))
+
+
+def _parse_hours(request, default, max_hours=MAX_WINDOW_HOURS, strict=True):
+    """Read the `hours` query param as an integer clamped to [1, max_hours]."""
+    return _parse_int_param(request, 'hours', default, max_hours, strict)
+
+
+def _buffer_circuit_open():
+    """Whether buffer reads are currently short-circuited."""
+    return time.monotonic() < _buffer_breaker['open_until']
+
+
+def _buffer_read_failed(error):
+    """Count a failed buffer read, opening the circuit at the threshold."""
+    _buffer_breaker['failures'] += 1
+    logger.warning("Sensor buffer read failed: %s", error)
+    if _buffer_breaker['failures'] >= BUFFER_BREAKER_THRESHOLD:
+        _buffer_breaker['open_until'] = time.monotonic() + BUFFER_BREAKER_COOLDOWN
+        _buffer_breaker['failures'] = 0
+        logger.warning("Sensor buffer circuit open for %.0fs", BUFFER_BREAKER_COOLDOWN)
+
+
+def _unavailable_buffer():
+    """Response body for a buffer that could not be read, reporting the circuit state."""
+    circuit = 'open' if _buffer_circuit_open() else 'closed'
+    return {'readings': [], 'stats': {'count': 0, 'is_full': False, 'circuit': circuit}}
+
+
+def _wants_stream(request):
+    """Whether the caller asked for an unpaginated, streamed export."""
+    return request.query_params.get('stream', '').lower() == 'true'
+
+
+def _stream_json(queryset, serializer_class):
+    """
+    Stream a queryset as a JSON array.
+
+    Rows are pulled from a server-side cursor in chunks and serialized one at
+    a time, so memory stays bounded by the chunk size rather than the result.
+    Each row is encoded with orjson when it is installed.
+    """
+    serializer = serializer_class()
+
+    def generate():
+        yield b'['
+        separator = b''
+        for obj in queryset.iterator(chunk_size=STREAM_CHUNK_SIZE):
+            yield separator + json_dumps(serializer.to_representation(obj))
+            separator = b','
+        yield b']'
+
+    return StreamingHttpResponse(generate(), content_type='application/json')
+
+
+def _wants_columnar(request):
+    """Whether the caller asked for the columnar (one array per field) layout."""
+    return request.query_params.get('layout') == 'columnar'
+
+
+def _columnar_response(queryset, fields):
+    """
+    Return a time series as {field: [values...]} instead of a list of objects.
+
+    Rows are read with values_list() and bypass the serializer; timestamps are
+    formatted the same way DateTimeField serializes them.
+    """
+    rows = list(queryset.values_list(*fields))
+    columns = {field: list(column) for field, column in zip(fields, zip(*rows))} if rows else {
+        field: [] for field in fields
+    }
+    if 'timestamp' in columns:
+        format_timestamp = serializers.DateTimeField().to_representation
+        columns['timestamp'] = [format_timestamp(ts) for ts in columns['timestamp']]
+    return Response(columns)
+
+
+def _bucketed_response(request, queryset):
+    """
+    Downsample a GridData series into time buckets when `granularity` is given.
+
+    Returns None when no bucketing was requested. Grouping and aggregation run
+    in the database; rows come back as dicts without model instantiation.
+    """
+    granularity = request.query_params.get('granularity')
+    if not granularity:
+        return None
+    trunc = BUCKET_FUNCTIONS.get(granularity)
+    if trunc is None:
+        raise ValidationError({'granularity': f"Must be one of: {', '.join(BUCKET_FUNCTIONS)}."})
+
+    # order_by() drops the model's default ordering, which would otherwise
+    # add timestamp to the GROUP BY
+    buckets = queryset.order_by().annotate(
+        bucket=trunc('timestamp')
+    ).values('bucket', 'zone').annotate(
+        avg=Avg('value'), min=Min('value'), max=Max('value'), count=Count('id')
+    ).order_by('bucket')
+
+    format_timestamp = serializers.DateTimeField().to_representation
+    return Response([dict(row, bucket=format_timestamp(row['bucket'])) for row in buckets])
 
 
 class SensorReadingViewSet(viewsets.ModelViewSet):
@@ -31,10 +202,12 @@ class SensorReadingViewSet(viewsets.ModelViewSet):
     """
     queryset = SensorReading.objects.all()
     serializer_class = SensorReadingSerializer
+    pagination_class = TimestampCursorPagination
     filterset_fields = ['sensor_type', 'sensor_id', 'location']
     ordering_fields = ['timestamp', 'created_at']
 
     @action(detail=False, methods=['get'])
+    @cache_response(lambda request: SENSOR_ALL_LATEST_CACHE_KEY, ttl=POLLING_CACHE_TTL)
     def all_latest(self, request):
         """
         Get all sensor readings as a single consolidated object.
@@ -42,24 +215,21 @@ class SensorReadingViewSet(viewsets.ModelViewSet):
         """
         # The sensor types currently used by your ESP32 and Models
         sensor_types = ['temperature', 'humidity', 'light', 'current', 'voltage']
-        sensor_data = {}
+        # Fallback if no data exists yet for a specific sensor type
+        sensor_data = dict.fromkeys(sensor_types, 0.0)
         last_updated = None
 
-        for s_type in sensor_types:
-            # Query the database for the single most recent record of this type
-            reading = SensorReading.objects.filter(
-                sensor_type=s_type
-            ).order_by('-timestamp').first()
-
-            if reading:
-                # Convert Decimal to float for JSON serialization
-                sensor_data[s_type] = float(reading.value)
-                # Track the most recent overall timestamp for the UI
-                if not last_updated or reading.timestamp > last_updated:
-                    last_updated = reading.timestamp
-            else:
-                # Fallback if no data exists yet for this specific sensor type
-                sensor_data[s_type] = 0.0
+        # The most recent record of every type in a single query
+        latest = SensorReading.objects.filter(
+            sensor_type__in=sensor_types
+        ).latest_per('sensor_type').values_list('sensor_type', 'value', 'timestamp')
+
+        for s_type, value, timestamp in latest:
+            # Convert Decimal to float for JSON serialization
+            sensor_data[s_type] = float(value)
+            # Track the most recent overall timestamp for the UI
+            if not last_updated or timestamp > last_updated:
+                last_updated = timestamp
 
         return Response({
             'timestamp': timezone.now().isoformat(),
@@ -71,20 +241,26 @@ class SensorReadingViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def recent(self, request):
         """Get recent readings within a time window."""
-        hours = int(request.query_params.get('hours', 1))
+        hours = _parse_hours(request, 1)
         sensor_type = request.query_params.get('sensor_type')
         sensor_id = request.query_params.get('sensor_id')
         
-        start_time = timezone.now() - timedelta(hours=hours)
-        queryset = self.queryset.filter(timestamp__gte=start_time)
-        
+        # Build the filter once so the queryset is cloned a single time
+        filters = {'timestamp__gte': timezone.now() - timedelta(hours=hours)}
         if sensor_type:
-            queryset = queryset.filter(sensor_type=sensor_type)
+            filters['sensor_type'] = sensor_type
         if sensor_id:
-            queryset = queryset.filter(sensor_id=sensor_id)
+            filters['sensor_id'] = sensor_id
+        queryset = self.get_queryset().filter(**filters)
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        if _wants_columnar(request):
+            return _columnar_response(queryset, ('sensor_type', 'sensor_id', 'timestamp', 'value', 'unit'))
+        if _wants_stream(request):
+            return _stream_json(queryset, self.get_serializer_class())
+        
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['get'])
     def buffer(self, request):
@@ -98,14 +274,79 @@ class SensorReadingViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        buffer_manager = SensorBufferManager()
-        readings = buffer_manager.get_latest_readings(sensor_type, sensor_id)
-        stats = buffer_manager.get_buffer_stats(sensor_type, sensor_id)
+        if _buffer_circuit_open():
+            return Response(_unavailable_buffer())
         
-        return Response({
+        buffer_manager = get_buffer_manager()
+        try:
+            readings = buffer_manager.get_latest_readings(sensor_type, sensor_id)
+        except Exception as e:
+            _buffer_read_failed(e)
+            return Response(_unavailable_buffer())
+        _buffer_breaker['failures'] = 0
+        stats = buffer_manager.summarize_buffer(readings)
+        
+        if _wants_columnar(request):
+            readings = {
+                'timestamp': [reading['timestamp'] for reading in readings],
+                'value': [reading['value'] for reading in readings],
+            }
+        
+        response = Response({
             'readings': readings,
             'stats': stats
         })
+        # Let browsers collapse rapid repeat polls of the same buffer
+        patch_cache_control(response, max_age=1, stale_while_revalidate=5)
+        return response
+
+    @action(detail=False, methods=['post'])
+    def buffers(self, request):
+        """
+        Get hot path buffers for several sensors in one request.
+        
+        Request body:
+        {
+            "sensors": [
+                {"sensor_type": "ldr", "sensor_id": "ldr_1"},
+                {"sensor_type": "current", "sensor_id": "current_1"}
+            ]
+        }
+        """
+        sensors = request.data.get('sensors')
+        if not isinstance(sensors, list) or not sensors:
+            return Response(
+                {'error': 'sensors must be a non-empty list'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        pairs = []
+        for sensor in sensors:
+            if not isinstance(sensor, dict) or not sensor.get('sensor_type') or not sensor.get('sensor_id'):
+                return Response(
+                    {'error': 'each sensor needs sensor_type and sensor_id'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            pairs.append((sensor['sensor_type'], sensor['sensor_id']))
+        
+        if _buffer_circuit_open():
+            return Response({f"{sensor_type}:{sensor_id}": _unavailable_buffer() for sensor_type, sensor_id in pairs})
+        
+        buffer_manager = get_buffer_manager()
+        try:
+            buffers = buffer_manager.get_latest_readings_batch(pairs)
+        except Exception as e:
+            _buffer_read_failed(e)
+            return Response({f"{sensor_type}:{sensor_id}": _unavailable_buffer() for sensor_type, sensor_id in pairs})
+        _buffer_breaker['failures'] = 0
+        
+        return Response({
+            f"{sensor_type}:{sensor_id}": {
+                'readings': readings,
+                'stats': buffer_manager.summarize_buffer(readings)
+            }
+            for (sensor_type, sensor_id), readings in buffers.items()
+        })
 
 
 class GridDataViewSet(viewsets.ModelViewSet):
@@ -115,57 +356,55 @@ class GridDataViewSet(viewsets.ModelViewSet):
     """
     queryset = GridData.objects.all()
     serializer_class = GridDataSerializer
+    pagination_class = TimestampCursorPagination
     filterset_fields = ['data_type', 'zone']
     ordering_fields = ['timestamp', 'created_at']
 
     @action(detail=False, methods=['get'])
-    def latest(self, request):
-        """Get the latest data for each data type."""
-        data_type = request.query_params.get('data_type')
-        
-        queryset = self.queryset
-        if data_type:
-            queryset = queryset.filter(data_type=data_type)
-        
-        # Get latest for each data type
-        latest_data = []
-        seen_types = set()
-        
-        for data in queryset:
-            if data.data_type not in seen_types:
-                latest_data.append(data)
-                seen_types.add(data.data_type)
-        
-        serializer = self.get_serializer(latest_data, many=True)
-        return Response(serializer.data)
-
-    @action(detail=False, methods=['get'])
+    @method_decorator(cache_page(GRID_SERIES_CACHE_SECONDS))
     def carbon_intensity(self, request):
         """Get recent carbon intensity readings."""
-        hours = int(request.query_params.get('hours', 24))
+        hours = _parse_hours(request, 24)
         start_time = timezone.now() - timedelta(hours=hours)
         
-        queryset = self.queryset.filter(
+        queryset = self.get_queryset().filter(
             data_type='carbon_intensity',
             timestamp__gte=start_time
         )
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        bucketed = _bucketed_response(request, queryset)
+        if bucketed is not None:
+            return bucketed
+        if _wants_columnar(request):
+            return _columnar_response(queryset, ('timestamp', 'value', 'unit', 'zone'))
+        if _wants_stream(request):
+            return _stream_json(queryset, self.get_serializer_class())
+        
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @method_decorator(cache_page(GRID_SERIES_CACHE_SECONDS))
     def weather(self, request):
         """Get recent weather data."""
-        hours = int(request.query_params.get('hours', 24))
+        hours = _parse_hours(request, 24)
         start_time = timezone.now() - timedelta(hours=hours)
         
-        queryset = self.queryset.filter(
+        queryset = self.get_queryset().filter(
             data_type='weather',
             timestamp__gte=start_time
         )
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        bucketed = _bucketed_response(request, queryset)
+        if bucketed is not None:
+            return bucketed
+        if _wants_stream(request):
+            return _stream_json(queryset, self.get_serializer_class())
+        
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 class UserPreferencesViewSet(viewsets.ModelViewSet):
@@ -187,15 +426,20 @@ class UserPreferencesViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            preference = self.queryset.get(preference_key=key)
-            serializer = self.get_serializer(preference)
-            return Response(serializer.data)
-        except UserPreferences.DoesNotExist:
+        data = get_cached_preference(key, self._load_preference)
+        if data is None:
             return Response(
                 {'error': 'Preference not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        return Response(data)
+
+    def _load_preference(self, key):
+        """Serialized preference for `key`, or None if there is none."""
+        preference = self.get_queryset().filter(preference_key=key).first()
+        if preference is None:
+            return None
+        return self.get_serializer(preference).data
 
 
 class AIDecisionViewSet(viewsets.ModelViewSet):
@@ -205,32 +449,36 @@ class AIDecisionViewSet(viewsets.ModelViewSet):
     """
     queryset = AIDecision.objects.all()
     serializer_class = AIDecisionSerializer
+    pagination_class = TimestampCursorPagination
     filterset_fields = ['decision_type', 'applied']
     ordering_fields = ['timestamp', 'created_at', 'confidence']
 
     @action(detail=False, methods=['get'])
     def recent(self, request):
         """Get recent AI decisions."""
-        hours = int(request.query_params.get('hours', 24))
+        hours = _parse_hours(request, 24)
         decision_type = request.query_params.get('decision_type')
         
-        start_time = timezone.now() - timedelta(hours=hours)
-        queryset = self.queryset.filter(timestamp__gte=start_time)
-        
+        filters = {'timestamp__gte': timezone.now() - timedelta(hours=hours)}
         if decision_type:
-            queryset = queryset.filter(decision_type=decision_type)
+            filters['decision_type'] = decision_type
+        queryset = self.get_queryset().filter(**filters)
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
     
     @action(detail=False, methods=['get'])
+    @cache_response(
+        lambda request: decision_latest_key(request.query_params.get('decision_type')),
+        ttl=POLLING_CACHE_TTL,
+    )
     def latest(self, request):
         """Get the most recent AI decision."""
         decision_type = request.query_params.get('decision_type')
         
-        queryset = self.queryset
-        if decision_type:
-            queryset = queryset.filter(decision_type=decision_type)
+        filters = {'decision_type': decision_type} if decision_type else {}
+        queryset = self.get_queryset().filter(**filters)
         
         latest = queryset.order_by('-timestamp').first()
         
@@ -243,30 +491,25 @@ class AIDecisionViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def history(self, request):
         """Get a list of recent AI decisions with summary data for display."""
-        limit = int(request.query_params.get('limit', 10))
-        limit = min(limit, 50)  # Cap at 50
+        limit = _parse_int_param(request, 'limit', 10, 50)
         
-        decisions = self.queryset.order_by('-timestamp')[:limit]
+        # Pull only the summary keys out of the decision JSON in SQL rather
+        # than loading whole decision blobs (with their forecasts) into Python
+        summary = {
+            key: F(f'decision__current_decision__{key}')
+            for key in HISTORY_SUMMARY_DEFAULTS
+        }
+        decisions = self.get_queryset().order_by('-timestamp').values(
+            'id', 'timestamp', 'decision_type', 'reasoning', 'confidence', 'applied', **summary
+        )[:limit]
         
         result = []
         for decision in decisions:
-            decision_data = decision.decision or {}
-            current_decision = decision_data.get('current_decision', {})
-            
-            result.append({
-                'id': decision.id,
-                'timestamp': decision.timestamp.isoformat(),
-                'decision_type': decision.decision_type,
-                'reasoning': decision.reasoning,
-                'confidence': decision.confidence,
-                'applied': decision.applied,
-                'primary_source': current_decision.get('primary_source', 'unknown'),
-                'predicted_demand_kwh': current_decision.get('predicted_demand_kwh', 0),
-                'battery_percentage': current_decision.get('battery_percentage', 0),
-                'solar_available': current_decision.get('solar_available', 0),
-                'cost': current_decision.get('cost', 0),
-                'carbon': current_decision.get('carbon', 0),
-            })
+            decision['timestamp'] = decision['timestamp'].isoformat()
+            for key, default in HISTORY_SUMMARY_DEFAULTS.items():
+                if decision[key] is None:
+                    decision[key] = default
+            result.append(decision)
         
         return Response({
             'count': len(result),
@@ -283,9 +526,11 @@ class EnergySourceViewSet(viewsets.ModelViewSet):
     serializer_class = EnergySourceSerializer
 
     @action(detail=False, methods=['get'])
+    @method_decorator(cache_control(max_age=30, public=True))
+    @cache_response(lambda request: AVAILABLE_SOURCES_CACHE_KEY, etag=True)
     def available(self, request):
         """Get all available energy sources."""
-        queryset = self.queryset.filter(is_available=True)
+        queryset = self.get_queryset().filter(is_available=True)
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
@@ -303,14 +548,15 @@ class LoadViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def active(self, request):
         """Get all currently active loads."""
-        queryset = self.queryset.filter(is_active=True)
+        queryset = self.get_queryset().filter(is_active=True)
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
+    @method_decorator(cache_page(SHORT_CACHE_SECONDS))
     def high_priority(self, request):
         """Get all high and critical priority loads."""
-        queryset = self.queryset.filter(priority__gte=75)
+        queryset = self.get_queryset().filter(priority__gte=75)
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
@@ -322,7 +568,7 @@ class LoadViewSet(viewsets.ModelViewSet):
         This endpoint allows Module 3 (AI) to override with ML-based recommendations.
         """
         load = self.get_object()
-        optimizer = EnergySourceOptimizer()
+        optimizer = get_energy_optimizer()
         
         recommendation = optimizer.recommend_source_for_load(
             load_name=load.name,
@@ -344,7 +590,7 @@ class LoadViewSet(viewsets.ModelViewSet):
                 'error': 'Load has no current source assigned'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        optimizer = EnergySourceOptimizer()
+        optimizer = get_energy_optimizer()
         switch_recommendation = optimizer.should_switch_source(
             current_source=load.current_source,
             load_name=load.name,
@@ -359,20 +605,26 @@ class SourceSwitchEventViewSet(viewsets.ModelViewSet):
     ViewSet for SourceSwitchEvent model.
     Tracks energy source switching history and analytics.
     """
-    queryset = SourceSwitchEvent.objects.all()
+    # The serializer reads load.name, so join the load up front; of the load's
+    # columns only its name is selected
+    queryset = SourceSwitchEvent.objects.select_related('load').only(
+        *(f.name for f in SourceSwitchEvent._meta.concrete_fields), 'load__name'
+    )
     serializer_class = SourceSwitchEventSerializer
+    pagination_class = TimestampCursorPagination
     filterset_fields = ['load', 'to_source', 'triggered_by', 'success']
     ordering_fields = ['timestamp']
     
     @action(detail=False, methods=['get'])
     def recent(self, request):
         """Get recent switch events."""
-        hours = int(request.query_params.get('hours', 24))
+        hours = _parse_hours(request, 24)
         start_time = timezone.now() - timedelta(hours=hours)
         
-        queryset = self.queryset.filter(timestamp__gte=start_time)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        queryset = self.get_queryset().filter(timestamp__gte=start_time)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
     
     @action(detail=False, methods=['get'])
     def by_load(self, request):
@@ -384,9 +636,10 @@ class SourceSwitchEventViewSet(viewsets.ModelViewSet):
                 'error': 'load_id parameter required'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        queryset = self.queryset.filter(load_id=load_id)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        queryset = self.get_queryset().filter(load_id=load_id)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 class EnergyOptimizationViewSet(viewsets.ViewSet):
@@ -418,7 +671,7 @@ class EnergyOptimizationViewSet(viewsets.ViewSet):
                 'error': 'load_name is required'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        optimizer = EnergySourceOptimizer()
+        optimizer = get_energy_optimizer()
         recommendation = optimizer.recommend_source_for_load(
             load_name=load_name,
             load_priority=load_priority,
@@ -428,6 +681,7 @@ class EnergyOptimizationViewSet(viewsets.ViewSet):
         return Response(recommendation)
     
     @action(detail=False, methods=['get'])
+    @method_decorator(cache_page(SHORT_CACHE_SECONDS))
     def context(self, request):
         """
         Get current context for energy optimization.
@@ -435,12 +689,13 @@ class EnergyOptimizationViewSet(viewsets.ViewSet):
         Returns all relevant data: sensors, weather, carbon, energy sources.
         Module 3 (AI) can use this to make informed decisions.
         """
-        optimizer = EnergySourceOptimizer()
+        optimizer = get_energy_optimizer()
         context = optimizer.gather_context()
         
         return Response(context)
     
     @action(detail=False, methods=['get'])
+    @method_decorator(cache_page(SHORT_CACHE_SECONDS))
     def distribution(self, request):
         """
         Get optimal distribution of loads across energy sources.
@@ -448,7 +703,7 @@ class EnergyOptimizationViewSet(viewsets.ViewSet):
         This is a placeholder for Module 3 (AI) to implement sophisticated
         load balancing algorithms.
         """
-        optimizer = EnergySourceOptimizer()
+        optimizer = get_energy_optimizer()
         distribution = optimizer.get_optimal_source_distribution()
         
         return Response(distribution)
@@ -479,26 +734,35 @@ class EnergyOptimizationViewSet(viewsets.ViewSet):
                 'error': 'load_id and to_source are required'
             }, status=status.HTTP_400_BAD_REQUEST)
         
+        # One timestamp for the event, the load update and the MQTT command
+        now = timezone.now()
+        
         try:
-            load = Load.objects.get(id=load_id)
+            with transaction.atomic():
+                # Lock the load row so concurrent switches record the right from_source
+                load = Load.objects.select_for_update().only(
+                    'id', 'name', 'current_source'
+                ).get(id=load_id)
+                
+                # Record the switch event
+                switch_event = SourceSwitchEvent.objects.create(
+                    load=load,
+                    from_source=load.current_source,
+                    to_source=to_source,
+                    reason=reason,
+                    triggered_by=triggered_by,
+                    timestamp=now,
+                )
+                
+                # Update load's current source (only the columns that change)
+                Load.objects.filter(pk=load.pk).update(
+                    current_source=to_source, updated_at=now
+                )
         except Load.DoesNotExist:
             return Response({
                 'error': 'Load not found'
             }, status=status.HTTP_404_NOT_FOUND)
         
-        # Record the switch event
-        switch_event = SourceSwitchEvent.objects.create(
-            load=load,
-            from_source=load.current_source,
-            to_source=to_source,
-            reason=reason,
-            triggered_by=triggered_by,
-        )
-        
-        # Update load's current source
-        load.current_source = to_source
-        load.save()
-        
         serializer = SourceSwitchEventSerializer(switch_event)
         
         return Response({
@@ -511,7 +775,7 @@ class EnergyOptimizationViewSet(viewsets.ViewSet):
                     'load_id': load.id,
                     'load_name': load.name,
                     'to_source': to_source,
-                    'timestamp': timezone.now().isoformat(),
+                    'timestamp': now.isoformat(),
                 }
             },
             'note': 'Module 1 (Hardware) should subscribe to MQTT commands and execute the physical switch'
@@ -531,9 +795,10 @@ class AIPredictionViewSet(viewsets.ViewSet):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.ai_service = SimpleAIService()
+        self.ai_service = get_ai_service()
     
     @action(detail=False, methods=['get'])
+    @method_decorator(cache_page(SHORT_CACHE_SECONDS))
     def status(self, request):
         """
         Check AI service status and availability.
@@ -541,6 +806,7 @@ class AIPredictionViewSet(viewsets.ViewSet):
         Returns information about loaded models and capabilities.
         """
         status = self.ai_service.get_status()
+        status['decision_writer'] = get_writer_stats()
         return Response(status)
     
     @action(detail=False, methods=['get'])
@@ -564,26 +830,19 @@ class AIPredictionViewSet(viewsets.ViewSet):
             "available": true
         }
         """
-        try:
-            hours = int(request.query_params.get('hours', 6))
-        except (ValueError, TypeError):
-            hours = 6
-        hours = max(1, min(hours, 24))  # Clamp between 1 and 24 hours
+        hours = _parse_hours(request, 6, max_hours=24, strict=False)
         
         result = self.ai_service.forecast_demand(hours_ahead=hours)
         
         # Record the prediction
-        try:
-            AIDecision.objects.create(
-                decision_type='general',
-                timestamp=timezone.now(),
-                decision=result,
-                confidence=0.85,
-                applied=False,
-                reasoning=result.get('recommendation', 'Energy demand forecast')
-            )
-        except Exception as e:
-            print(f"Warning: Could not record forecast: {e}")
+        record_decision(
+            decision_type='general',
+            timestamp=timezone.now(),
+            decision=result,
+            confidence=0.85,
+            applied=False,
+            reasoning=result.get('recommendation', 'Energy demand forecast')
+        )
         
         return Response(result)
     
@@ -594,11 +853,7 @@ class AIPredictionViewSet(viewsets.ViewSet):
         
         Returns upcoming peak hours and high-demand periods.
         """
-        try:
-            hours = int(request.query_params.get('hours', 24))
-        except (ValueError, TypeError):
-            hours = 24
-        hours = max(1, min(hours, 48))  # Clamp between 1 and 48 hours
+        hours = _parse_hours(request, 24, max_hours=48, strict=False)
         
         result = self.ai_service.forecast_demand(hours_ahead=hours)
         
@@ -633,17 +888,14 @@ class AIPredictionViewSet(viewsets.ViewSet):
         )
         
         # Record the recommendation
-        try:
-            AIDecision.objects.create(
-                decision_type='power_source',
-                timestamp=timezone.now(),
-                decision=result,
-                confidence=result.get('confidence', 0.85),
-                applied=False,
-                reasoning=result.get('reasoning', '')
-            )
-        except Exception as e:
-            print(f"Warning: Could not record recommendation: {e}")
+        record_decision(
+            decision_type='power_source',
+            timestamp=timezone.now(),
+            decision=result,
+            confidence=result.get('confidence', 0.85),
+            applied=False,
+            reasoning=result.get('reasoning', '')
+        )
         
         return Response(result)
     
@@ -675,21 +927,19 @@ class AIPredictionViewSet(viewsets.ViewSet):
         result = self.ai_service.make_decision()
         
         # Record the decision
-        try:
-            AIDecision.objects.create(
-                decision_type='general',
-                timestamp=timezone.now(),
-                decision=result,
-                confidence=0.85,
-                applied=True,
-                reasoning=result.get('recommendation', '')
-            )
-        except Exception as e:
-            print(f"Warning: Could not record decision: {e}")
+        record_decision(
+            decision_type='general',
+            timestamp=timezone.now(),
+            decision=result,
+            confidence=0.85,
+            applied=True,
+            reasoning=result.get('recommendation', '')
+        )
         
         return Response(result)
     
     @action(detail=False, methods=['get'])
+    @method_decorator(cache_page(SHORT_CACHE_SECONDS))
     def conditions(self, request):
         """
         Get current sensor conditions being used by AI.
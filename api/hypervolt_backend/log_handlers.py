@@ -0,0 +1,22 @@
+"""
+Logging handlers for the HyperVolt backend.
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class BackgroundStreamHandler(QueueHandler):
+    """
+    Stream handler that writes log records from a background thread.
+
+    Records are formatted and queued by the calling thread, then written to the
+    stream by a QueueListener, so request threads never block on stdout/stderr I/O.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(queue.SimpleQueue())
+        self.listener = QueueListener(self.queue, logging.StreamHandler(stream))
+        self.listener.start()
+        atexit.register(self.listener.stop)
@@ -0,0 +1,45 @@
+"""
+DRF renderers for the HyperVolt backend.
+"""
+import json
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson, falling back to DRF's stdlib renderer.
+
+    Types orjson does not handle natively (Decimal, lazy strings, ...) and
+    datetimes are passed to DRF's encoder so the output format is unchanged.
+    Indented output (requested via the Accept header) uses the stdlib path.
+    """
+    _default = JSONEncoder().default
+
+    if ORJSON_AVAILABLE:
+        _options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not ORJSON_AVAILABLE or self.get_indent(accepted_media_type or '', renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        return dumps(data)
+
+
+def dumps(data):
+    """
+    Encode data to JSON bytes the same way ORJSONRenderer does.
+
+    Used by views that bypass the renderer, e.g. streamed responses.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=ORJSONRenderer._default, option=ORJSONRenderer._options)
+    return json.dumps(data, cls=JSONEncoder).encode()
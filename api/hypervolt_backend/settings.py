@@ -102,9 +102,18 @@ DATABASES = {
         'PASSWORD': env('DB_PASSWORD', default=''),
         'HOST': env('DB_HOST', default=''),
         'PORT': env('DB_PORT', default=''),
+        # Persistent connections help WSGI workers and the django-q cluster.
+        # Leave at 0 under ASGI (daphne): each request runs its sync code in a
+        # fresh thread, so kept-alive connections would pile up.
+        'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=0),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Covering indexes (Index.include) are PostgreSQL-only; the SQLite development
+# database simply ignores the non-key columns.
+SILENCED_SYSTEM_CHECKS = ['models.W040']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -176,6 +185,13 @@ CACHES = {
         "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # One bounded pool per process; redis-py picks the hiredis parser
+            # automatically when it is installed
+            "CONNECTION_POOL_KWARGS": {
+                "max_connections": env.int('REDIS_MAX_CONNECTIONS', default=100),
+                "retry_on_timeout": True,
+                "socket_keepalive": True,
+            },
         }
     }
 }
@@ -183,7 +199,7 @@ CACHES = {
 # Django REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'hypervolt_backend.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -227,7 +243,33 @@ LOCATION_LAT = env.float('LOCATION_LAT', default=12.9716)
 LOCATION_LON = env.float('LOCATION_LON', default=77.5946)
 LOCATION_ZONE = env('LOCATION_ZONE', default='IN-KA')
 
+# Logging Configuration
+# Application loggers write through a queue so the AI/request path never blocks on I/O
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'verbose': {
+            'format': '{asctime} {levelname} {name}: {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'background_console': {
+            'class': 'hypervolt_backend.log_handlers.BackgroundStreamHandler',
+            'formatter': 'verbose',
+        },
+    },
+    'loggers': {
+        'data_pipeline': {
+            'handlers': ['background_console'],
+            'level': env('LOG_LEVEL', default='INFO'),
+        },
+    },
+}
+
 # Hot Path Configuration - Sliding window buffer size
 SENSOR_BUFFER_SIZE = 60  # Last 60 readings
 SENSOR_BUFFER_KEY_PREFIX = 'sensor_buffer'
+SENSOR_BUFFER_LOCAL_TTL = 1  # Seconds a buffer read is served from process memory
 
@@ -6,10 +6,9 @@ and exports graphs matching the website forecast visualization
 """
 
 import os
-import random
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
@@ -39,78 +38,89 @@ PEAK_POWER_RANGE = (1700, 2500)        # 1.7 - 2.5 kW = 1700-2500 mW
 NIGHT_POWER_RANGE = (300, 500)         # 0.3 - 0.5 kW = 300-500 mW
 
 
-def is_peak_hour(hour: int, is_weekend: bool) -> bool:
-    """Check if given hour is a peak hour based on day type"""
-    if is_weekend:
-        return (WEEKEND_PEAK_HOURS['afternoon'][0] <= hour <= WEEKEND_PEAK_HOURS['afternoon'][1] or
-                WEEKEND_PEAK_HOURS['evening'][0] <= hour <= WEEKEND_PEAK_HOURS['evening'][1])
-    else:
-        return (WEEKDAY_PEAK_HOURS['morning'][0] <= hour <= WEEKDAY_PEAK_HOURS['morning'][1] or
-                WEEKDAY_PEAK_HOURS['evening'][0] <= hour <= WEEKDAY_PEAK_HOURS['evening'][1])
-
+def peak_hour_mask(hours, is_weekend):
+    """Vectorized is_peak_hour: elementwise over arrays of hours and weekend flags"""
+    hours = np.asarray(hours)
+    weekend = ((WEEKEND_PEAK_HOURS['afternoon'][0] <= hours) & (hours <= WEEKEND_PEAK_HOURS['afternoon'][1]) |
+               (WEEKEND_PEAK_HOURS['evening'][0] <= hours) & (hours <= WEEKEND_PEAK_HOURS['evening'][1]))
+    weekday = ((WEEKDAY_PEAK_HOURS['morning'][0] <= hours) & (hours <= WEEKDAY_PEAK_HOURS['morning'][1]) |
+               (WEEKDAY_PEAK_HOURS['evening'][0] <= hours) & (hours <= WEEKDAY_PEAK_HOURS['evening'][1]))
+    return np.where(is_weekend, weekend, weekday)
 
-def get_power_consumption(hour: int, is_weekend: bool) -> float:
-    """Calculate power consumption for a given hour"""
-    if hour <= 6:
-        return random.uniform(*NIGHT_POWER_RANGE)
-    if is_peak_hour(hour, is_weekend):
-        return random.uniform(*PEAK_POWER_RANGE)
-    return random.uniform(*NORMAL_POWER_RANGE)
 
-
-def generate_day_data(date: datetime) -> list:
-    """Generate 24 hours of data for a given date"""
-    day_of_week = date.weekday()
+def is_peak_hour(hour: int, is_weekend: bool) -> bool:
+    """Check if given hour is a peak hour based on day type"""
+    return bool(peak_hour_mask(hour, is_weekend))
+
+
+def generate_days_data(start_date: datetime, days: int) -> pd.DataFrame:
+    """
+    Generate hourly data for `days` consecutive days starting at start_date
+    Every column is computed as one array over all days x 24 hours
+    """
+    rng = np.random.default_rng()
+    start = pd.Timestamp(start_date).normalize()
+    n = days * 24
+    
+    hours = np.tile(np.arange(24), days)
+    day_offsets = np.repeat(np.arange(days), 24)
+    dates = pd.date_range(start, periods=days, freq='D')
+    day_of_week = np.repeat(dates.weekday.to_numpy(dtype=np.int64), 24)
     is_weekend = day_of_week >= 5
-    day_name = date.strftime('%A')
-    
-    records = []
-    for hour in range(24):
-        timestamp = date.replace(hour=hour, minute=0, second=0, microsecond=0)
-        power_mw = get_power_consumption(hour, is_weekend)
-        is_peak = is_peak_hour(hour, is_weekend)
-        
-        # Additional features
-        temperature = 20 + 10 * np.sin((hour - 6) * np.pi / 12) + random.uniform(-2, 2)
-        humidity = 50 + 20 * np.cos((hour - 12) * np.pi / 12) + random.uniform(-5, 5)
-        solar_irradiance = max(0, 800 * np.sin((hour - 6) * np.pi / 12)) if 6 <= hour <= 18 else 0
-        solar_irradiance += random.uniform(-50, 50) if solar_irradiance > 0 else 0
-        cloud_cover = random.uniform(0, 100)
-        
-        battery_soc = 50 + 30 * np.sin((hour - 12) * np.pi / 12) + random.uniform(-5, 5)
-        battery_soc = max(10, min(100, battery_soc))
-        
-        if solar_irradiance > 400 and cloud_cover < 50:
-            primary_source = 'solar'
-        elif battery_soc > 30:
-            primary_source = 'battery'
-        else:
-            primary_source = 'grid'
-        
-        records.append({
-            'timestamp': timestamp.isoformat(),
-            'date': date.strftime('%Y-%m-%d'),
-            'day_of_week': day_of_week,
-            'day_name': day_name,
-            'is_weekend': is_weekend,
-            'hour': hour,
-            'is_peak_hour': is_peak,
-            'power_consumption_mw': round(power_mw, 2),
-            'temperature_c': round(temperature, 1),
-            'humidity_percent': round(humidity, 1),
-            'solar_irradiance_wm2': round(max(0, solar_irradiance), 1),
-            'cloud_cover_percent': round(cloud_cover, 1),
-            'battery_soc_percent': round(battery_soc, 1),
-            'primary_source': primary_source,
-            'peak_start_morning': WEEKDAY_PEAK_HOURS['morning'][0] if not is_weekend else None,
-            'peak_end_morning': WEEKDAY_PEAK_HOURS['morning'][1] if not is_weekend else None,
-            'peak_start_afternoon': WEEKEND_PEAK_HOURS['afternoon'][0] if is_weekend else None,
-            'peak_end_afternoon': WEEKEND_PEAK_HOURS['afternoon'][1] if is_weekend else None,
-            'peak_start_evening': WEEKEND_PEAK_HOURS['evening'][0] if is_weekend else WEEKDAY_PEAK_HOURS['evening'][0],
-            'peak_end_evening': WEEKEND_PEAK_HOURS['evening'][1] if is_weekend else WEEKDAY_PEAK_HOURS['evening'][1],
-        })
-    
-    return records
+    is_peak = peak_hour_mask(hours, is_weekend)
+    
+    # Night hours first, then peak, then normal - same precedence as before
+    power_mw = np.where(
+        hours <= 6, rng.uniform(*NIGHT_POWER_RANGE, n),
+        np.where(is_peak, rng.uniform(*PEAK_POWER_RANGE, n), rng.uniform(*NORMAL_POWER_RANGE, n))
+    )
+    
+    # Additional features
+    temperature = 20 + 10 * np.sin((hours - 6) * np.pi / 12) + rng.uniform(-2, 2, n)
+    humidity = 50 + 20 * np.cos((hours - 12) * np.pi / 12) + rng.uniform(-5, 5, n)
+    daylight = (hours >= 6) & (hours <= 18)
+    solar_irradiance = np.where(daylight, np.maximum(0, 800 * np.sin((hours - 6) * np.pi / 12)), 0)
+    solar_irradiance = solar_irradiance + np.where(solar_irradiance > 0, rng.uniform(-50, 50, n), 0)
+    cloud_cover = rng.uniform(0, 100, n)
+    
+    battery_soc = 50 + 30 * np.sin((hours - 12) * np.pi / 12) + rng.uniform(-5, 5, n)
+    battery_soc = np.clip(battery_soc, 10, 100)
+    
+    primary_source = np.select(
+        [(solar_irradiance > 400) & (cloud_cover < 50), battery_soc > 30],
+        ['solar', 'battery'],
+        default='grid'
+    )
+    
+    timestamps = start + pd.to_timedelta(day_offsets * 24 + hours, unit='h')
+    
+    return pd.DataFrame({
+        'timestamp': timestamps.map(pd.Timestamp.isoformat),
+        'date': np.repeat(dates.strftime('%Y-%m-%d').to_numpy(), 24),
+        'day_of_week': day_of_week,
+        'day_name': np.repeat(dates.day_name().to_numpy(), 24),
+        'is_weekend': is_weekend,
+        'hour': hours,
+        'is_peak_hour': is_peak,
+        'power_consumption_mw': np.round(power_mw, 2),
+        'temperature_c': np.round(temperature, 1),
+        'humidity_percent': np.round(humidity, 1),
+        'solar_irradiance_wm2': np.round(np.maximum(0, solar_irradiance), 1),
+        'cloud_cover_percent': np.round(cloud_cover, 1),
+        'battery_soc_percent': np.round(battery_soc, 1),
+        'primary_source': primary_source,
+        'peak_start_morning': np.where(is_weekend, np.nan, WEEKDAY_PEAK_HOURS['morning'][0]),
+        'peak_end_morning': np.where(is_weekend, np.nan, WEEKDAY_PEAK_HOURS['morning'][1]),
+        'peak_start_afternoon': np.where(is_weekend, WEEKEND_PEAK_HOURS['afternoon'][0], np.nan),
+        'peak_end_afternoon': np.where(is_weekend, WEEKEND_PEAK_HOURS['afternoon'][1], np.nan),
+        'peak_start_evening': np.where(is_weekend, WEEKEND_PEAK_HOURS['evening'][0], WEEKDAY_PEAK_HOURS['evening'][0]),
+        'peak_end_evening': np.where(is_weekend, WEEKEND_PEAK_HOURS['evening'][1], WEEKDAY_PEAK_HOURS['evening'][1]),
+    })
+
+
+def generate_day_data(date: datetime) -> pd.DataFrame:
+    """Generate 24 hours of data for a given date"""
+    return generate_days_data(date, 1)
 
 
 def generate_week_dataset(start_date: datetime = None) -> pd.DataFrame:
@@ -118,13 +128,7 @@ def generate_week_dataset(start_date: datetime = None) -> pd.DataFrame:
     if start_date is None:
         start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
     
-    all_records = []
-    for day_offset in range(7):
-        current_date = start_date + timedelta(days=day_offset)
-        day_data = generate_day_data(current_date)
-        all_records.extend(day_data)
-    
-    return pd.DataFrame(all_records)
+    return generate_days_data(start_date, 7)
 
 
 def export_day_graph(df: pd.DataFrame, day_name: str, day_offset: int):
@@ -34,6 +34,9 @@ class HyperVoltEnergyModel:
     
     def __init__(self):
         self.peak_classifier = None
+        # Classifier output for every (day_of_week, hour), filled in after training
+        self.peak_table = None
+        self.confidence_table = None
         self.power_model = None
         self.is_trained = False
         self.training_date = None
@@ -83,7 +86,7 @@ class HyperVoltEnergyModel:
         X, y_peak, y_power = self.prepare_features(df)
         
         # Split data
-        X_train, X_test, y_train, qy_test = train_test_split(
+        X_train, X_test, y_train, y_test = train_test_split(
             X, y_peak, test_size=0.2, random_state=42
         )
         
@@ -92,6 +95,7 @@ class HyperVoltEnergyModel:
             n_estimators=100, max_depth=10, random_state=42
         )
         self.peak_classifier.fit(X_train, y_train)
+        self._build_lookup_tables()
         
         # Evaluate
         y_pred = self.peak_classifier.predict(X_test)
@@ -111,6 +115,28 @@ class HyperVoltEnergyModel:
         
         return True
     
+    @staticmethod
+    def _feature_frame(day_of_week, hour) -> pd.DataFrame:
+        """Classifier input for arrays of days of week and hours"""
+        return pd.DataFrame({
+            'day_of_week': day_of_week,
+            'hour': hour,
+            'is_weekend': (day_of_week >= 5).astype(int),
+            'hour_sin': np.sin(2 * np.pi * hour / 24),
+            'hour_cos': np.cos(2 * np.pi * hour / 24)
+        })
+    
+    def _build_lookup_tables(self):
+        """
+        Evaluate the classifier once for all 7 x 24 possible inputs
+        Its features are only day of week and hour, so predictions reduce to table lookups
+        """
+        days = np.repeat(np.arange(7), 24)
+        hours = np.tile(np.arange(24), 7)
+        X = self._feature_frame(days, hours)
+        self.peak_table = self.peak_classifier.predict(X).astype(bool).reshape(7, 24)
+        self.confidence_table = self.peak_classifier.predict_proba(X)[:, 1].reshape(7, 24)
+    
     def predict_peak_hours(self, day_of_week: int) -> dict:
         """
         Predict peak hours for a given day of the week
@@ -137,42 +163,28 @@ class HyperVoltEnergyModel:
             'normal_hours': []
         }
         
-        for hour in range(24):
-            # Prepare input
-            X = pd.DataFrame([{
-                'day_of_week': day_of_week,
-                'hour': hour,
-                'is_weekend': is_weekend,
-                'hour_sin': np.sin(2 * np.pi * hour / 24),
-                'hour_cos': np.cos(2 * np.pi * hour / 24)
-            }])
-            
-            # Predict
-            is_peak = bool(self.peak_classifier.predict(X)[0])
-            confidence = float(self.peak_classifier.predict_proba(X)[0][1])
-            
-            # Estimate power based on peak status
-            if hour <= 6:
-                est_power = 400  # Night
-            elif is_peak:
-                est_power = 2100  # Peak
-            else:
-                est_power = 1100  # Normal
-            
-            prediction = {
+        # Predict: one row of the precomputed classifier tables
+        hours = np.arange(24)
+        is_peak = self.peak_table[day_of_week]
+        confidence = self.confidence_table[day_of_week]
+        
+        # Estimate power based on peak status: night, peak, normal
+        est_power = np.where(hours <= 6, 400, np.where(is_peak, 2100, 1100))
+        
+        results['predictions'] = [
+            {
                 'hour': hour,
                 'time': f'{hour:02d}:00',
-                'is_peak': is_peak,
-                'confidence': round(confidence, 3),
-                'estimated_power_mw': est_power
+                'is_peak': peak,
+                'confidence': round(conf, 3),
+                'estimated_power_mw': power
             }
-            
-            results['predictions'].append(prediction)
-            
-            if is_peak:
-                results['peak_hours'].append(hour)
-            else:
-                results['normal_hours'].append(hour)
+            for hour, peak, conf, power in zip(
+                hours.tolist(), is_peak.tolist(), confidence.tolist(), est_power.tolist()
+            )
+        ]
+        results['peak_hours'] = hours[is_peak].tolist()
+        results['normal_hours'] = hours[~is_peak].tolist()
         
         return results
     
@@ -187,6 +199,8 @@ class HyperVoltEnergyModel:
         
         model_data = {
             'peak_classifier': self.peak_classifier,
+            'peak_table': self.peak_table,
+            'confidence_table': self.confidence_table,
             'is_trained': self.is_trained,
             'training_date': self.training_date,
             'accuracy': self.accuracy
@@ -211,6 +225,11 @@ class HyperVoltEnergyModel:
             model_data = pickle.load(f)
         
         self.peak_classifier = model_data['peak_classifier']
+        self.peak_table = model_data.get('peak_table')
+        self.confidence_table = model_data.get('confidence_table')
+        if self.peak_table is None:
+            # Saved before the lookup tables existed
+            self._build_lookup_tables()
         self.is_trained = model_data['is_trained']
         self.training_date = model_data['training_date']
         self.accuracy = model_data['accuracy']
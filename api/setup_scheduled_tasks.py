@@ -19,19 +19,13 @@ def setup_tasks():
     
     tasks = [
         {
-            'name': 'Fetch Carbon Intensity',
-            'func': 'data_pipeline.tasks.fetch_carbon_intensity',
+            # Fetches carbon intensity and weather concurrently
+            'name': 'Fetch External Data',
+            'func': 'data_pipeline.tasks.fetch_all_external',
             'schedule_type': Schedule.MINUTES,
             'minutes': 15,
             'repeats': -1,  # Infinite repeats
         },
-        {
-            'name': 'Fetch Weather Data',
-            'func': 'data_pipeline.tasks.fetch_weather_data',
-            'schedule_type': Schedule.MINUTES,
-            'minutes': 15,
-            'repeats': -1,
-        },
         {
             'name': 'Cleanup Old Data',
             'func': 'data_pipeline.tasks.cleanup_old_data',
@@ -40,6 +34,12 @@ def setup_tasks():
         },
     ]
     
+    # These are now covered by 'Fetch External Data'
+    superseded = ['Fetch Carbon Intensity', 'Fetch Weather Data']
+    removed, _ = Schedule.objects.filter(name__in=superseded).delete()
+    if removed:
+        print(f"✓ Removed {removed} superseded scheduled task(s)")
+    
     for task_config in tasks:
         schedule, created = Schedule.objects.get_or_create(
             name=task_config['name'],